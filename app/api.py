@@ -1,11 +1,17 @@
-from flask import Flask, request, jsonify
+from flask import Flask, abort, request, jsonify
 from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.solution_cache import get_default_cache
 from src.models.demand_model import DemandModel
+from src.web.serialization import response_format, solution_response
 
 app = Flask(__name__)
 
 @app.route('/solve', methods=['POST'])
 def solve():
+    try:
+        fmt = response_format(request)
+    except ValueError as e:
+        abort(400, description=str(e))
     data = request.json
     T = data['horizon']
     I_max = data['max_inventory']
@@ -16,16 +22,21 @@ def solve():
         T=T,
         I_max=I_max,
         x_max=x_max,
-        costs={'c': costs['c'], 'h': costs['h'], 'p': costs['p']},
-        demand_dist=DemandModel(demand_params['support'], demand_params['probabilities'])
+        costs={'c': costs['c'], 'h': costs['h'], 'p': costs['p'], 'K': costs.get('K', 0)},
+        demand_dist=DemandModel(demand_params['support'], demand_params['probabilities']),
+        method='sS' if costs.get('K', 0) else 'vectorized',
+        verify_sS=True
     )
-    V, policy = solver.solve()
-    result = {
-        'value_function': V.tolist(),
-        'policy': policy.tolist(),
-        'solution_time': solver.solution_time
-    }
-    return jsonify(result)
+    V, policy = get_default_cache().solve(solver)
+    return solution_response(
+        fmt, V, policy, I_init=int(data.get('initial_inventory', 0)),
+        summary=solver.summary(),
+        solution_time=solver.solution_time
+    )
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    return jsonify(get_default_cache().stats())
 
 if __name__ == '__main__':
     app.run(debug=True)
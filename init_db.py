@@ -1,5 +1,10 @@
-from src.data.database_manager import init_db
+from src.data.database_manager import backfill_inventory_levels, get_session, init_db
 
 if __name__ == "__main__":
-    engine = init_db()          # Crea todas las tablas
+    engine = init_db()          # Crea todas las tablas y añade columnas nuevas
     print("Tablas creadas en:", engine.url)
+    session = get_session(engine)
+    filled = backfill_inventory_levels(session)   # Filas de optimal_policies anteriores a inventory_level
+    session.commit()
+    if filled:
+        print("inventory_level completado en", filled, "filas de optimal_policies")
@@ -6,6 +6,7 @@ Métodos: Programación Dinámica, Heurística (s,S), Simulación Monte Carlo, P
 import time
 import numpy as np
 from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.policy_simulator import PolicySimulator
 from src.models.demand_model import DemandModel
 from scipy.optimize import linprog
 
@@ -41,15 +42,8 @@ def run_comparison(T, I_max, x_max, support, probs, costs):
     # 3) Simulación Monte Carlo
     N = 10000
     t0_mc = time.perf_counter()
-    cost_mc = 0.0
-    for _ in range(N):
-        inv = costs['initial_inventory']
-        for t in range(T):
-            x = int(policy_dp[t, inv])
-            d = np.random.choice(support, p=probs)
-            inv = max(inv + x - d, 0)
-            cost_mc += costs['c'][t] * x + costs['h'] * inv + costs['p'] * max(-inv, 0)
-    cost_mc /= N
+    simulator = PolicySimulator(policy_dp, costs, dm, I_init=costs['initial_inventory'])
+    cost_mc = float(simulator.simulate(N)['total_cost'].mean())
     t_mc = time.perf_counter() - t0_mc
 
     # 4) Programación Lineal
@@ -2,8 +2,7 @@
 import time
 import numpy as np
 import pandas as pd
-from src.core.dynamic_programming_solver import DynamicProgrammingSolver
-from src.models.demand_model import DemandModel
+from src.core.experiment_runner import make_instance, run_instances
 
 
 def main():
@@ -39,21 +38,18 @@ def main():
     for esc in scenarios:
         esc["probs"] = esc["probs"] / esc["probs"].sum()
 
-    resultados = []
-    for esc in scenarios:
-        dm = DemandModel(esc["support"], esc["probs"])
-        solver = DynamicProgrammingSolver(
-            T=T,
-            I_max=I_max,
-            x_max=x_max,
-            costs=esc["costs"],
-            demand_dist=dm
-        )
-        solver.solve()
+    instances = [
+        make_instance(T, I_max, x_max, esc["costs"], esc["support"], esc["probs"], I_init=I0)
+        for esc in scenarios
+    ]
+    # En serie: se reportan tiempos de solución por escenario
+    outputs = run_instances(instances, outputs=("V0", "solution_time", "memory_bytes"), max_workers=1)
 
-        costo_opt = float(solver.V[0, I0])
-        tiempo = solver.solution_time
-        memoria_mb = solver.V.nbytes / (1024 * 1024)
+    resultados = []
+    for esc, out in zip(scenarios, outputs):
+        costo_opt = out["V0"]
+        tiempo = out["solution_time"]
+        memoria_mb = out["memory_bytes"] / (1024 * 1024)
 
         resultados.append({
             "Escenario": esc["Escenario"],
@@ -2,10 +2,9 @@
 """
 Análisis de Sensibilidad Global (Sección 8.3.3): Sobol indices para parámetros de costo.
 """
-import numpy as np
 from SALib.sample import saltelli
 from SALib.analyze import sobol
-from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.batch_solver import BatchDynamicProgrammingSolver
 from src.models.demand_model import DemandModel
 
 # Definición del problema para SALib
@@ -24,23 +23,21 @@ param_values = saltelli.sample(problem, 512, calc_second_order=False)
 support = list(range(11))
 probs = [1/11] * 11
 
-# Función objetivo: V0 dado un conjunto de parámetros
-def evaluate(params):
-    c_val, h_val, p_val = params
+# Función objetivo: V0 para todas las muestras en un solo lote
+def evaluate(samples):
     # Costos constantes a lo largo del horizonte
     T = 12
-    c_ts = np.full(T, c_val)
     dm = DemandModel(support, probs)
-    solver = DynamicProgrammingSolver(
+    solver = BatchDynamicProgrammingSolver(
         T=T, I_max=100, x_max=50,
-        costs={'c': c_ts, 'h': h_val, 'p': p_val},
+        costs={'c': samples[:, 0], 'h': samples[:, 1], 'p': samples[:, 2]},
         demand_dist=dm
     )
-    V, _ = solver.solve()
-    return V[0, 0]
+    solver.solve()
+    return solver.initial_values(0)
 
 # Evaluar el modelo sobre todas las muestras
-y = np.array([evaluate(x) for x in param_values])
+y = evaluate(param_values)
 
 # Calcular índices de Sobol
 ti = sobol.analyze(problem, y, calc_second_order=False)
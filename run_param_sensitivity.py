@@ -4,22 +4,23 @@ Análisis de Sensibilidad Paramétrica (Sección 8.1)
 Varía los costos de almacenamiento y penalización y calcula V0 e incremento porcentual.
 """
 import numpy as np
-from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.batch_solver import BatchDynamicProgrammingSolver
 from src.models.demand_model import DemandModel
 
 def solve_dp(T, I_max, x_max, c, h, p, support, probs, I0=0):
     """
-    Resuelve DP y retorna V0 para inventario inicial I0.
+    Resuelve DP en lote y retorna V0 para inventario inicial I0.
+    c, h y p pueden ser escalares o arreglos con un valor por escenario.
     """
-    costs = { 'c': np.full(T, c), 'h': h, 'p': p }
+    costs = { 'c': np.atleast_1d(c), 'h': h, 'p': p }
     dm = DemandModel(support, probs)
-    solver = DynamicProgrammingSolver(
+    solver = BatchDynamicProgrammingSolver(
         T=T, I_max=I_max, x_max=x_max,
         costs=costs,
         demand_dist=dm
     )
-    V, _ = solver.solve()
-    return float(V[0, I0])
+    solver.solve()
+    return solver.initial_values(I0)
 
 if __name__ == '__main__':
     # Parámetros base
@@ -35,16 +36,18 @@ if __name__ == '__main__':
 
     # Sensibilidad a p
     print("Sensibilidad a la penalización p:")
-    V_base = solve_dp(T, I_max, x_max, c_base, h_base, p_base, support, probs, I0)
-    for p in [10, 20, 50]:
-        V0 = solve_dp(T, I_max, x_max, c_base, h_base, p, support, probs, I0)
+    p_vals = [p_base, 10, 20, 50]
+    V0s = solve_dp(T, I_max, x_max, c_base, h_base, np.array(p_vals), support, probs, I0)
+    V_base = V0s[0]
+    for p, V0 in zip(p_vals[1:], V0s[1:]):
         delta = (V0 - V_base) / V_base * 100
         print(f"  p={p}: V0={V0:.1f}, Δ={delta:+.1f}%")
 
     # Sensibilidad a h
     print("\nSensibilidad al costo de almacenamiento h:")
-    V_base = solve_dp(T, I_max, x_max, c_base, h_base, p_base, support, probs, I0)
-    for h in [1, 2, 5]:
-        V0 = solve_dp(T, I_max, x_max, c_base, h, p_base, support, probs, I0)
+    h_vals = [h_base, 1, 2, 5]
+    V0s = solve_dp(T, I_max, x_max, c_base, np.array(h_vals), p_base, support, probs, I0)
+    V_base = V0s[0]
+    for h, V0 in zip(h_vals[1:], V0s[1:]):
         delta = (V0 - V_base) / V_base * 100
         print(f"  h={h}: V0={V0:.1f}, Δ={delta:+.1f}%")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark de persistencia de OptimalPolicy y OptimizationResult.
+Compara filas/segundo del esquema anterior (un session.add por fila y
+varios commits) con la inserción en bloque en una sola transacción y con
+el almacenamiento 'blob' (V y policy comprimidos, un registro por solución).
+
+Uso: python run_persistence_benchmark.py [DATABASE_URL]
+(por defecto una base SQLite temporal)
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.data.database_manager import (
+    get_session, init_db, save_policy_summary, save_solution_blob,
+    User, Material, Optimization, OptimalPolicy, OptimizationResult, OptimizationSolution
+)
+from src.models.demand_model import DemandModel
+from src.utils.helpers import policy_summary
+from src.web.optimization_jobs import save_solution_rows
+
+T = 52
+I_max = 1000
+x_max = 200
+costs = {'c': [10.0] * T, 'h': 2.0, 'p': 20.0}
+support = list(range(0, 41))
+probs = [1 / 41] * 41
+
+
+def new_optimization(session, name):
+    opt = Optimization(
+        user_id=1, material_id=1, name=name, horizon=T,
+        initial_inventory=0, max_inventory=I_max, max_order=x_max,
+        costs=costs, demand_params={'support': support, 'probabilities': probs},
+        status='running'
+    )
+    session.add(opt)
+    session.commit()
+    return opt
+
+
+def persist_per_row(session, opt, V, policy, demand_dist):
+    """Esquema anterior: un objeto ORM por fila y cálculos por fila."""
+    for t in range(policy.shape[0]):
+        for I, x in enumerate(policy[t]):
+            session.add(OptimalPolicy(
+                optimization_id=opt.id, period=t, inventory_level=I,
+                reorder_point=I if x > 0 else 0, order_up_to_level=I + int(x),
+                expected_cost=float(V[t, I]), created_at=datetime.utcnow()
+            ))
+    session.commit()
+
+    s = demand_dist.get_support()
+    p = demand_dist.get_probabilities()
+    for t in range(policy.shape[0]):
+        for I in range(I_max + 1):
+            x = int(policy[t, I])
+            exp_holding = float(np.sum(p * np.maximum(I + x - s, 0) * costs['h']))
+            exp_shortage = float(np.sum(p * np.maximum(s - (I + x), 0) * costs['p']))
+            session.add(OptimizationResult(
+                optimization_id=opt.id, period=t, inventory_level=float(I),
+                optimal_order=float(x), expected_demand=float(np.dot(s, p)),
+                expected_holding_cost=exp_holding, expected_shortage_cost=exp_shortage,
+                total_period_cost=float(costs['c'][t] * x) + exp_holding + exp_shortage,
+                created_at=datetime.utcnow()
+            ))
+    session.commit()
+    return 2 * policy.size
+
+
+def persist_bulk(session, opt, V, policy, demand_dist):
+    """Esquema nuevo: columnas vectorizadas e inserción en bloque."""
+    n_rows = save_solution_rows(session, opt, V, policy, demand_dist)
+    session.commit()
+    return n_rows
+
+
+def persist_blob(session, opt, V, policy, demand_dist):
+    """Modo 'blob': V y policy comprimidos más el resumen (s_t, S_t)."""
+    save_solution_blob(session, opt.id, V, policy)
+    save_policy_summary(session, opt.id, policy_summary(policy))
+    session.commit()
+    solution = session.query(OptimizationSolution).filter_by(optimization_id=opt.id).one()
+    size = len(solution.value_function) + len(solution.policy)
+    print(f"  blob: {size / 1024:,.0f} KiB comprimidos para {2 * policy.size} filas equivalentes")
+    return 2 * policy.size
+
+
+def main():
+    if len(sys.argv) > 1:
+        db_url = sys.argv[1]
+    else:
+        db_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    session = get_session(init_db(db_url))
+    if session.get(User, 1) is None:
+        session.add(User(id=1, username='bench', email='bench@example.com', password_hash=''))
+    if session.get(Material, 1) is None:
+        session.add(Material(id=1, name='bench', type='default', unit_cost=0, storage_cost=0, shortage_penalty=0))
+    session.commit()
+
+    dm = DemandModel(support, probs)
+    solver = DynamicProgrammingSolver(T, I_max, x_max, costs, dm, method='base_stock')
+    V, policy = solver.solve()
+    print(f"T={T}, I_max={I_max}: {2 * policy.size} filas por optimización ({db_url})")
+
+    for name, persist in [('por fila', persist_per_row), ('en bloque', persist_bulk),
+                          ('blob', persist_blob)]:
+        opt = new_optimization(session, name)
+        start = time.perf_counter()
+        n_rows = persist(session, opt, V, policy, dm)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<10}: {n_rows} filas en {elapsed:.2f}s → {n_rows / elapsed:,.0f} filas/s")
+
+
+if __name__ == '__main__':
+    main()
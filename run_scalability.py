@@ -3,8 +3,7 @@ import time, math
 import itertools
 import numpy as np
 import pandas as pd
-from src.core.dynamic_programming_solver import DynamicProgrammingSolver
-from src.models.demand_model import DemandModel
+from src.core.experiment_runner import make_instance, run_instances
 
 def main():
     # Diseño experimental según informe
@@ -14,24 +13,19 @@ def main():
     D_support = np.arange(0, 11)               # |D| = 11
     D_probs   = np.full(11, 1/11)
 
-    data = []
-    for T, I_max, x_max in itertools.product(T_vals, I_vals, x_vals):
-        # Modelo de demanda uniforme
-        dm = DemandModel(D_support, D_probs)
-
-        # Inicializar solver con costos según Escenario Estacionario (c_t=10,h=2,p=20)
-        solver = DynamicProgrammingSolver(
-            T=T,
-            I_max=I_max,
-            x_max=x_max,
-            costs={'c': np.full(T, 10), 'h': 2, 'p': 20},
-            demand_dist=dm
-        )
+    # Instancias con costos según Escenario Estacionario (c_t=10,h=2,p=20)
+    grid = list(itertools.product(T_vals, I_vals, x_vals))
+    instances = [
+        make_instance(T, I_max, x_max, {'c': np.full(T, 10), 'h': 2, 'p': 20}, D_support, D_probs)
+        for T, I_max, x_max in grid
+    ]
 
-        # Ejecutar y tomar tiempo de solución
-        solver.solve()
-        t_exec = solver.solution_time
+    # En serie: en paralelo los tiempos por instancia se contaminan por contención
+    outputs = run_instances(instances, outputs=('solution_time',), max_workers=1)
 
+    data = []
+    for (T, I_max, x_max), out in zip(grid, outputs):
+        t_exec = out['solution_time']
         data.append({
             'T': T,
             'I_max': I_max,
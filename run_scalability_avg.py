@@ -1,24 +1,12 @@
 #!/usr/bin/env python3
-import time, itertools
+import itertools
 import numpy as np
 import pandas as pd
-from src.core.dynamic_programming_solver import DynamicProgrammingSolver
-from src.models.demand_model import DemandModel
+from src.core.experiment_runner import make_instance, run_instances
 
 # Número de repeticiones por punto
 REPS = 5
 
-def timed_solve(solver):
-    # warm-up
-    solver.solve()
-    # repeticiones medidas
-    ts = []
-    for _ in range(REPS):
-        start = time.perf_counter()
-        solver.solve()
-        ts.append(time.perf_counter() - start)
-    return np.mean(ts)
-
 def main():
     T_vals = [6,12,24]
     I_vals = [50,100,200]
@@ -26,15 +14,19 @@ def main():
     D_support = np.arange(11)
     D_probs   = np.full(11, 1/11)
 
+    # warm-up + REPS repeticiones medidas por instancia, en paralelo
+    grid = list(itertools.product(T_vals, I_vals, x_vals))
+    instances = [
+        make_instance(T, I_max, x_max, {'c': np.full(T,10),'h':2,'p':20}, D_support, D_probs,
+                      repeats=REPS, warmup=True)
+        for T,I_max,x_max in grid
+    ]
+    # En serie: en paralelo los tiempos por instancia se contaminan por contención
+    outputs = run_instances(instances, outputs=('solution_time',), max_workers=1)
+
     records = []
-    for T,I_max,x_max in itertools.product(T_vals, I_vals, x_vals):
-        dm = DemandModel(D_support, D_probs)
-        solver = DynamicProgrammingSolver(
-            T=T, I_max=I_max, x_max=x_max,
-            costs={'c': np.full(T,10),'h':2,'p':20},
-            demand_dist=dm
-        )
-        t_exec = timed_solve(solver)
+    for (T,I_max,x_max), out in zip(grid, outputs):
+        t_exec = out['solution_time']
         records.append({
             'T': T,
             'I_max': I_max,
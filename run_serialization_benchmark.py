@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización de V y policy para /solve y POST /optimization:
+tiempo de codificación y tamaño de la respuesta en cada formato.
+
+Uso: python run_serialization_benchmark.py
+"""
+import time
+
+from flask import Flask
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.models.demand_model import DemandModel
+from src.web.serialization import RESPONSE_FORMATS, solution_response
+
+T = 52
+I_max = 5000
+x_max = 500
+costs = {'c': [10.0] * T, 'h': 2.0, 'p': 20.0}
+support = list(range(0, 41))
+probs = [1 / 41] * 41
+
+
+def main():
+    solver = DynamicProgrammingSolver(T, I_max, x_max, costs, DemandModel(support, probs), method='base_stock')
+    V, policy = solver.solve()
+    print(f"T={T}, I_max={I_max} (resuelto en {solver.solution_time:.2f}s)")
+
+    app = Flask(__name__)
+    baseline = None
+    with app.app_context():
+        for fmt in RESPONSE_FORMATS:
+            start = time.perf_counter()
+            body = solution_response(fmt, V, policy, solution_time=solver.solution_time).get_data()
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = (elapsed, len(body))
+            print(f"  {fmt:<8}: {len(body) / 1024:>10,.0f} KiB en {elapsed:.3f}s "
+                  f"(x{baseline[1] / len(body):.1f} menor, x{baseline[0] / elapsed:.1f} más rápido)")
+
+
+if __name__ == '__main__':
+    main()
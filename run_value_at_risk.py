@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """
 Cálculo de Value at Risk (VaR) para el costo total de inventario (Sección 8.3.2)
-Compute VaR at niveles α = 0.95 y 0.99 usando simulación Monte Carlo.
+Compute VaR at niveles α = 0.95 y 0.99 de forma exacta (propagación de la
+distribución del costo) y, como contraste, con simulación Monte Carlo.
 """
 import numpy as np
 from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.policy_evaluator import PolicyEvaluator, value_at_risk
+from src.core.policy_simulator import PolicySimulator
 from src.models.demand_model import DemandModel
 
 # Parámetros del problema (consistentes con Sección 8.3)
@@ -27,28 +30,22 @@ solver = DynamicProgrammingSolver(T=T, I_max=I_max, x_max=x_max,
 V, policy = solver.solve()
 
 # Función para simular costo total dado la política
-def simulate_cost(policy, support, probs, I_init=0, N=10000):
-    costs = np.zeros(N)
-    for i in range(N):
-        I = I_init
-        total = 0.0
-        for t in range(T):
-            x = int(policy[t, I])
-            D = np.random.choice(support, p=probs)
-            purchase = c_ts[t] * x
-            hold = h * max(I + x - D, 0)
-            short = p * max(D - I - x, 0)
-            total += purchase + hold + short
-            I = max(I + x - D, 0)
-        costs[i] = total
-    return costs
+def simulate_cost(policy, support, probs, I_init=0, N=10000, seed=None):
+    simulator = PolicySimulator(policy, {'c': c_ts, 'h': h, 'p': p},
+                                DemandModel(support, probs), I_init=I_init, seed=seed)
+    return simulator.simulate(N)['total_cost']
 
 if __name__ == '__main__':
+    # Distribución exacta del costo total (cubetas de 1 unidad monetaria)
+    evaluator = PolicyEvaluator(policy, {'c': c_ts, 'h': h, 'p': p}, dm, I_init=0)
+    values, value_probs = evaluator.cost_distribution(bucket_width=1.0)
+
     # Simulación Monte Carlo
     N = 10000
     costs = simulate_cost(policy, support, probs, I_init=0, N=N)
 
     # Calcular VaR
     for alpha in [0.95, 0.99]:
+        var_exact = value_at_risk(values, value_probs, alpha)
         var = np.percentile(costs, alpha * 100)
-        print(f"VaR (α={alpha}): {var:.1f}")
+        print(f"VaR (α={alpha}): exacto={var_exact:.1f}, Monte Carlo={var:.1f}")
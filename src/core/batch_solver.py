@@ -0,0 +1,90 @@
+import numpy as np
+import time
+
+from src.models.cost_model import CostModel
+from src.utils.mathematical_utils import window_argmin
+
+
+class BatchDynamicProgrammingSolver:
+    """
+    Backward induction simultánea para S escenarios de costos (c_t, h, p)
+    que comparten T, I_max, x_max y la distribución de demanda.
+
+    V y policy llevan un eje inicial de escenario: (S, T+1, I_max+1) y
+    (S, T, I_max+1). Cada periodo se resuelve como el método 'order_up_to'
+    de DynamicProgrammingSolver, vectorizado sobre los escenarios.
+    """
+
+    def __init__(self, T, I_max, x_max, costs: dict, demand_dist):
+        """
+        Args:
+            T: Horizonte de planificación
+            I_max: Nivel máximo de inventario
+            x_max: Cantidad máxima de orden
+            costs: Dict con arreglos por escenario:
+                'c': forma (S,) (costo constante por escenario), (S, 1) o (S, T).
+                    A diferencia de DynamicProgrammingSolver, un vector 1-D es
+                    por escenario, no por periodo; si su longitud es T (> 1) es
+                    ambiguo y se exige la forma 2-D
+                'h': forma (S,) o escalar
+                'p': forma (S,) o escalar
+                No admite costo fijo 'K' (use DynamicProgrammingSolver con method='sS')
+            demand_dist: Objeto con métodos get_support() y get_probabilities()
+        """
+        self.T = int(T)
+        self.I_max = int(I_max)
+        self.x_max = int(x_max)
+        self.demand_dist = demand_dist
+
+        if np.any(np.asarray(costs.get('K', 0)) != 0):
+            raise ValueError("El solver por lotes no admite costo fijo K; use DynamicProgrammingSolver con method='sS'.")
+
+        c = np.asarray(costs['c'], dtype=float)
+        h = np.atleast_1d(np.asarray(costs['h'], dtype=float))
+        p = np.atleast_1d(np.asarray(costs['p'], dtype=float))
+        n_scenarios = max(len(c) if c.ndim else 1, len(h), len(p))
+        if c.ndim == 1 and len(c) == self.T > 1:
+            raise ValueError(f"'c' 1-D de longitud T={self.T} es ambiguo: use forma (S, 1) para costos "
+                             f"por escenario o (S, T) para costos por periodo.")
+        if c.ndim <= 1 or c.shape == (n_scenarios, 1):
+            c = np.broadcast_to(c.reshape(-1, 1), (n_scenarios, self.T))
+        if c.shape != (n_scenarios, self.T):
+            raise ValueError(f"'c' debe tener forma (S,), (S, 1) o (S, T); se recibió {c.shape}.")
+
+        self.n_scenarios = n_scenarios
+        self.costs = c
+        self.h = np.broadcast_to(h, (n_scenarios,))
+        self.p = np.broadcast_to(p, (n_scenarios,))
+
+        self.V = np.full((n_scenarios, self.T + 1, self.I_max + 1), np.inf)
+        self.policy = np.zeros((n_scenarios, self.T, self.I_max + 1), dtype=int)
+        self.solution_time = 0.0
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Ejecuta backward induction para todos los escenarios.
+        Devuelve (V, policy) con eje inicial de escenario.
+        """
+        start = time.time()
+        levels = np.arange(self.I_max + 1)
+        cost_model = CostModel(self.h[:, None], self.p[:, None])
+        loss = cost_model.expected_loss(self.demand_dist, self.I_max)
+
+        self.V[:, self.T, :] = 0
+        for t in range(self.T - 1, -1, -1):
+            future = cost_model.expected_future(self.V[:, t + 1, :], self.demand_dist)
+            c_t = self.costs[:, t, None]
+            H = c_t * levels + loss + future
+
+            best_x, best_H = window_argmin(H, self.x_max + 1)
+            self.V[:, t, :] = best_H - c_t * levels
+            self.policy[:, t, :] = best_x
+
+        self.solution_time = time.time() - start
+        return self.V, self.policy
+
+    def initial_values(self, I_init: int = 0) -> np.ndarray:
+        """
+        Devuelve V_0(I_init) para cada escenario (forma (S,)).
+        """
+        return self.V[:, 0, int(I_init)].copy()
@@ -1,5 +1,20 @@
+import json
+import os
 import numpy as np
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.inventory_model import InventoryModel
+from src.core.solution_cache import SolutionCache
+from src.models.cost_model import CostModel
+from src.models.demand_model import bucket_demand
+from src.models.policy_model import PolicyModel
+from src.utils.helpers import binary_search_minimum, policy_summary
+from src.utils.mathematical_utils import is_unimodal, sparse_window_argmin, window_argmin
+
+SOLVER_METHODS = ('enumeration', 'vectorized', 'order_up_to', 'base_stock', 'multigrid', 'sS')
+MEMORY_MODES = ('full', 'low')
+
 
 class DynamicProgrammingSolver:
     """
@@ -7,30 +22,156 @@ class DynamicProgrammingSolver:
     optimización de inventario estocástico conforme al informe.
     """
 
-    def __init__(self, T, I_max, x_max, costs: dict, demand_dist):
+    def __init__(self, T, I_max, x_max, costs: dict, demand_dist, method: str = 'vectorized',
+                 memory_mode: str = 'full', value_dtype=np.float64, I_init: int = None,
+                 stationary_tol: float = None, n_workers: int = 1, chunk_size: int = None,
+                 checkpoint_dir: str = None, coarse_step: int = None, band: int = None,
+                 verify_sS: bool = False):
         """
         Args:
             T: Horizonte de planificación (int o float convertible)
             I_max: Nivel máximo de inventario (int o float convertible)
             x_max: Cantidad máxima de orden (int o float convertible)
             costs: Dict con {'c': secuencia de costos c_t, 'h': float, 'p': float}
+                y opcionalmente 'K': costo fijo por pedido (0 por defecto)
             demand_dist: Objeto con métodos get_support() y get_probabilities()
+            method: Motor de cálculo por periodo:
+                - 'enumeration': bucles explícitos sobre (I, x, D)
+                - 'vectorized': tensor (I, x) evaluado con NumPy por cada D;
+                  reproduce exactamente V y policy de 'enumeration'
+                - 'order_up_to': minimiza c_t·(y - I) + G_t(y) sobre el nivel
+                  de reposición y con tablas de costo esperado de CostModel,
+                  en O(I_max·x_max) por periodo
+                - 'base_stock': localiza el nivel S_t que minimiza c_t·y + G_t(y)
+                  con búsqueda binaria y fija x = clip(S_t - I, 0, x_max);
+                  si G_t no es unimodal en un periodo, enumera como 'order_up_to'
+                - 'multigrid': resuelve primero una malla gruesa (paso
+                  coarse_step, demanda en cubetas) y busca el nivel base fino
+                  solo en una banda de ±band niveles alrededor del grueso.
+                  V y x son exactos en todos los estados: H se evalúa en la
+                  malla fina y, si no es unimodal o su mínimo cae en el borde
+                  de la banda, el periodo se enumera como 'order_up_to' y se
+                  registra en band_edge_periods. approximation_gap[t] =
+                  max |V_t - V_t grueso interpolado| en la banda mide la
+                  calidad de la malla gruesa. Cada periodo cuesta lo mismo que
+                  'base_stock' (G_t en la malla fina) más la malla gruesa, así
+                  que no es más rápido que 'base_stock'
+                - 'sS': política (s_t, S_t) con costo fijo K por K-convexidad:
+                  S_t minimiza H(y) = c_t·y + G_t(y) y s_t es el mayor nivel
+                  con H(s_t) > K + H(S_t); el periodo cuesta O(I_max) además
+                  de G_t. Es óptima cuando H es K-convexa (sin que x_max
+                  limite los pedidos); con verify_sS=True cada periodo se
+                  compara con el mínimo exacto min(H(I), K + min_{I<y≤I+x_max} H(y))
+                  en O(I_max·log x_max) y, si no coincide, se usa el exacto y
+                  el periodo se registra en fallback_periods
+            memory_mode: Almacenamiento de las tablas:
+                - 'full': V de (T+1)×(I_max+1) y policy entera de T×(I_max+1)
+                - 'low': solo dos filas de V (al terminar V[0] = V_0 y
+                  V[1] = V_1) y policy con el menor dtype sin signo que
+                  contiene x_max; con 'base_stock' la política se guarda
+                  como PolicyModel (s_t, S_t) si todos los periodos son umbral
+            value_dtype: dtype de V (p.ej. np.float32 para reducir memoria)
+            I_init: Si se indica, solo se resuelven los estados alcanzables
+                desde I_init (reachable_bounds); en el resto V vale nan y la
+                política 0. Con 'base_stock' en modo 'low' la política
+                PolicyModel sigue definida en todos los estados.
+            stationary_tol: Si se indica y c_t es constante, la inducción se
+                detiene en el primer periodo t* cuya fila de política coincide
+                con la de t*+1 y cuyas diferencias V_t* - V_t*+1 cambian menos
+                que la tolerancia; los periodos anteriores reutilizan la fila
+                estacionaria: V_t = V_t* + (t* - t)·(V_t* - V_t*+1).
+                t* queda en converged_period.
+            n_workers: Hilos que evalúan en paralelo bloques de estados de un
+                mismo periodo ('vectorized' y 'order_up_to'; los kernels de
+                NumPy liberan el GIL). Cada periodo espera a todos los bloques.
+            chunk_size: Estados por bloque (por defecto, reparto equitativo
+                entre n_workers)
+            checkpoint_dir: Directorio donde V y policy se guardan como
+                archivos .npy mapeados en memoria (np.memmap) que se
+                actualizan periodo a periodo junto con progress.json; solve()
+                reanuda desde el último periodo completado si el directorio
+                contiene una resolución interrumpida del mismo problema.
+                Requiere memory_mode='full'.
+            coarse_step: Paso de la malla gruesa de 'multigrid'
+                (por defecto ≈ sqrt(I_max))
+            band: Semiancho de la banda de búsqueda del nivel base fino de
+                'multigrid' (por defecto 4·coarse_step + d_max)
+            verify_sS: Verificar cada periodo de 'sS' contra el mínimo exacto (ver 'sS')
         """
+        if method not in SOLVER_METHODS:
+            raise ValueError(f"Método de solución desconocido: {method!r} (opciones: {SOLVER_METHODS}).")
+        if memory_mode not in MEMORY_MODES:
+            raise ValueError(f"Modo de memoria desconocido: {memory_mode!r} (opciones: {MEMORY_MODES}).")
+        if costs.get('K', 0) and method in ('base_stock', 'multigrid'):
+            raise ValueError(f"El método {method!r} no admite costo fijo K; use 'sS'.")
+
         # Asegurar que T, I_max y x_max sean enteros
         self.T = int(T)
         self.I_max = int(I_max)
         self.x_max = int(x_max)
+        self.method = method
+        self.memory_mode = memory_mode
+        self.value_dtype = np.dtype(value_dtype)
 
         # Costos
         self.costs = costs['c']
         self.h = costs['h']
         self.p = costs['p']
+        self.K = float(costs.get('K', 0))
         self.demand_dist = demand_dist
+        self.cost_model = CostModel(self.h, self.p)
 
-        # Tablas de memoización
-        self.V = np.full((self.T + 1, self.I_max + 1), np.inf)
-        self.policy = np.zeros((self.T, self.I_max + 1), dtype=int)
+        # Malla gruesa del modo 'multigrid'
+        self.coarse_step = self.band = None
+        self.coarse_solver = None
+        self.approximation_gap = None
+        self.band_edge_periods = []
+        if method == 'multigrid':
+            self.coarse_step = int(coarse_step or max(1, round(np.sqrt(self.I_max))))
+            self.band = int(band or 4 * self.coarse_step + int(np.max(demand_dist.get_support())))
+            if not 1 <= self.coarse_step <= self.x_max:
+                raise ValueError(f"coarse_step debe estar en [1, x_max] (es {self.coarse_step}).")
+            if memory_mode != 'full' or I_init is not None:
+                raise ValueError("'multigrid' requiere memory_mode='full' y no admite I_init.")
+
+        # Tablas de memoización (en disco se crean al resolver)
+        self.checkpoint_dir = checkpoint_dir
+        if checkpoint_dir is not None and memory_mode != 'full':
+            raise ValueError("checkpoint_dir requiere memory_mode='full'.")
+        self._checkpoint_key = None
+        n_rows = self.T + 1 if memory_mode == 'full' else min(self.T + 1, 2)
+        if checkpoint_dir is None:
+            self.V = np.full((n_rows, self.I_max + 1), np.inf, dtype=self.value_dtype)
+            self.policy = self._allocate_policy()
+        else:
+            self.V = self.policy = None
         self.solution_time = 0.0
+        self.periods_solved = 0
+
+        self.n_workers = max(int(n_workers), 1)
+        self.verify_sS = bool(verify_sS)
+        self.chunk_size = None if chunk_size is None else max(int(chunk_size), 1)
+        self._executor = None
+
+        self.stationary_tol = None if stationary_tol is None else float(stationary_tol)
+        self.converged_period = None
+        if self.stationary_tol is not None and I_init is not None:
+            raise ValueError("stationary_tol no es compatible con la poda por I_init.")
+
+        # Intervalos [lo_t, hi_t] de estados alcanzables (None: todos)
+        self.I_init = None if I_init is None else int(I_init)
+        self.reachable_bounds = None
+        if self.I_init is not None:
+            if not 0 <= self.I_init <= self.I_max:
+                raise ValueError(f"I_init debe estar en [0, {self.I_max}] (es {self.I_init}).")
+            self.reachable_bounds = InventoryModel(self.I_init, self.I_max, self.x_max).reachable_intervals(
+                self.T, demand_dist.get_support()
+            )
+
+        # Niveles (s_t, S_t) de 'base_stock' y 'sS' (-1 en periodos enumerados)
+        self.order_up_to_levels = np.full(self.T, -1, dtype=int)
+        self.reorder_points = np.full(self.T, -1, dtype=int)
+        self.fallback_periods = []
 
     def solve(self) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -38,17 +179,338 @@ class DynamicProgrammingSolver:
         Devuelve (V, policy).
         """
         start = time.time()
-        # Condición terminal
-        self.V[self.T, :] = 0
+        completed = self._open_checkpoint() if self.checkpoint_dir is not None else None
+        if completed is None:
+            self.order_up_to_levels[:] = -1
+            self.reorder_points[:] = -1
+            self.fallback_periods = []
+            self.converged_period = None
+            if self.checkpoint_dir is None:
+                self.policy = self._allocate_policy()
+            # Condición terminal
+            self._clear_row(self.T)
+            lo, hi = self._states(self.T)
+            self.V[self._row(self.T), lo:hi + 1] = 0
+            self._checkpoint(self.T)
+            completed = self.T
 
         # Recursión hacia atrás
-        for t in range(self.T - 1, -1, -1):
-            for I in range(self.I_max + 1):
-                self._solve_state(t, I)
+        periods_solved = self._backward(completed - 1) if completed > 0 else 0
+
+        if self.policy is None:
+            self.policy = self.policy_model
 
         self.solution_time = time.time() - start
+        self.periods_solved = periods_solved
         return self.V, self.policy
 
+    def update_costs(self, c_ts) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Re-resuelve tras cambiar los costos c_t de una solución existente.
+
+        V_t solo depende de c_t..c_{T-1}, así que se conservan las filas de
+        los periodos posteriores al último c_t modificado y la inducción
+        hacia atrás se reanuda desde ese periodo. Requiere memory_mode='full'.
+
+        Returns:
+            (V, policy) actualizados; periods_solved indica cuántos periodos
+            se recalcularon.
+        """
+        self._check_incremental()
+        self._checkpoint_key = None
+        new_costs = np.asarray(c_ts, dtype=float)
+        old_costs = np.broadcast_to(np.asarray(self.costs, dtype=float), (self.T,))
+        if new_costs.shape != (self.T,):
+            raise ValueError(f"Se esperaban {self.T} costos c_t; se recibieron {new_costs.shape}.")
+
+        start = time.time()
+        changed = np.flatnonzero(new_costs != old_costs)
+        self.costs = new_costs
+        self.periods_solved = 0
+        if len(changed):
+            self._resume_from(int(changed.max()))
+        self.solution_time = time.time() - start
+        return self.V, self.policy
+
+    def prepend_periods(self, c_prefix) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Extiende el horizonte anteponiendo k periodos con costos c_prefix.
+
+        Las filas existentes pasan a ser los periodos k..T+k y solo se
+        resuelven los k periodos nuevos. Requiere memory_mode='full'.
+        """
+        self._check_incremental()
+        if self.reachable_bounds is not None:
+            raise ValueError("prepend_periods cambia los estados alcanzables: resuelva de nuevo sin I_init.")
+        if self.checkpoint_dir is not None:
+            raise ValueError("prepend_periods no admite checkpoint_dir: los archivos tienen T fijo.")
+        prefix = np.atleast_1d(np.asarray(c_prefix, dtype=float))
+        k = len(prefix)
+        old_costs = np.broadcast_to(np.asarray(self.costs, dtype=float), (self.T,))
+
+        start = time.time()
+        self.costs = np.concatenate([prefix, old_costs])
+        self.T += k
+        self.V = np.vstack([np.full((k, self.I_max + 1), np.inf, dtype=self.value_dtype), self.V])
+        self.policy = np.vstack([np.zeros((k, self.I_max + 1), dtype=self.policy.dtype), self.policy])
+        self.order_up_to_levels = np.concatenate([np.full(k, -1, dtype=int), self.order_up_to_levels])
+        self.reorder_points = np.concatenate([np.full(k, -1, dtype=int), self.reorder_points])
+        self.fallback_periods = [t + k for t in self.fallback_periods]
+        self.periods_solved = 0
+        self._resume_from(k - 1)
+        self.solution_time = time.time() - start
+        return self.V, self.policy
+
+    def _check_incremental(self):
+        if self.memory_mode != 'full':
+            raise ValueError("La re-solución incremental requiere memory_mode='full'.")
+        if not np.any(np.isfinite(self.V[self.T])):
+            raise ValueError("No hay una solución previa: ejecute solve() primero.")
+        # Las tablas de un acierto de SolutionCache son de solo lectura
+        if not self.V.flags.writeable:
+            self.V = self.V.copy()
+        if isinstance(self.policy, np.ndarray) and not self.policy.flags.writeable:
+            self.policy = self.policy.copy()
+
+    def _resume_from(self, t_start: int):
+        """
+        Recalcula los periodos t_start..0 conservando los posteriores.
+        """
+        self.order_up_to_levels[:t_start + 1] = -1
+        self.reorder_points[:t_start + 1] = -1
+        self.fallback_periods = [t for t in self.fallback_periods if t > t_start]
+        if self.converged_period is not None and self.converged_period <= t_start:
+            self.converged_period = None
+        self.periods_solved = self._backward(t_start)
+
+    def _backward(self, t_start: int):
+        """
+        Inducción hacia atrás desde el periodo t_start hasta 0 (o hasta
+        detectar la política estacionaria). Devuelve los periodos resueltos.
+        """
+        if self.n_workers > 1:
+            self._executor = ThreadPoolExecutor(self.n_workers)
+        try:
+            return self._backward_periods(t_start)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _backward_periods(self, t_start: int) -> int:
+        c = np.broadcast_to(np.asarray(self.costs, dtype=float), (self.T,))
+        if self.method == 'multigrid':
+            self._solve_coarse(c, t_start)
+        previous_diff = None
+        for t in range(t_start, -1, -1):
+            self._clear_row(t)
+            if self.method == 'vectorized':
+                self._solve_period_vectorized(t)
+            elif self.method == 'order_up_to':
+                self._solve_period_order_up_to(t)
+            elif self.method == 'base_stock':
+                self._solve_period_base_stock(t)
+            elif self.method == 'multigrid':
+                self._solve_period_multigrid(t)
+            elif self.method == 'sS':
+                self._solve_period_sS(t)
+            else:
+                lo, hi = self._states(t)
+                for I in range(lo, hi + 1):
+                    self._solve_state(t, I)
+
+            self._checkpoint(t)
+
+            if self.stationary_tol is None or t == 0 or np.any(c[:t + 2] != c[t]):
+                continue
+            diff = self.V[self._row(t)].astype(float) - self.V[self._row(t + 1)]
+            if previous_diff is not None and self._same_policy(t, t + 1) \
+                    and np.max(np.abs(diff - previous_diff)) <= self.stationary_tol:
+                self._fill_stationary(t, diff)
+                return t_start - t + 1
+            previous_diff = diff
+        return t_start + 1
+
+    def _map_chunks(self, func, lo: int, hi: int) -> list:
+        """
+        Aplica func(a, b) a bloques consecutivos [a, b) de los estados
+        lo..hi, en el pool de hilos si lo hay. Devuelve los resultados en
+        orden, una vez terminados todos (barrera entre periodos).
+        """
+        n = hi - lo + 1
+        size = self.chunk_size or -(-n // self.n_workers)
+        bounds = [(a, min(a + size, hi + 1)) for a in range(lo, hi + 1, size)]
+        if self._executor is None or len(bounds) == 1:
+            return [func(a, b) for a, b in bounds]
+        return list(self._executor.map(lambda ab: func(*ab), bounds))
+
+    def _same_policy(self, t: int, k: int) -> bool:
+        if self.policy is None:
+            return (self.order_up_to_levels[t] == self.order_up_to_levels[k]
+                    and self.reorder_points[t] == self.reorder_points[k])
+        return np.array_equal(self.policy[t], self.policy[k])
+
+    def _fill_stationary(self, t: int, diff: np.ndarray):
+        """
+        Completa los periodos 0..t-1 con la fila estacionaria del periodo t.
+        """
+        self.converged_period = t
+        V_t = self.V[self._row(t)].astype(float)
+        # En modo 'low' solo se conservan V_1 y V_0
+        periods = range(t - 1, -1, -1) if self.memory_mode == 'full' else [k for k in (1, 0) if k < t]
+        for k in periods:
+            self.V[self._row(k)] = V_t + (t - k) * diff
+        self.order_up_to_levels[:t] = self.order_up_to_levels[t]
+        self.reorder_points[:t] = self.reorder_points[t]
+        if t in self.fallback_periods:
+            self.fallback_periods.extend(range(t - 1, -1, -1))
+        if self.policy is not None:
+            self.policy[:t] = self.policy[t]
+        self._checkpoint(0)
+
+    def _checkpoint_paths(self) -> dict:
+        return {name: os.path.join(self.checkpoint_dir, name)
+                for name in ('V.npy', 'policy.npy', 'progress.json')}
+
+    def _open_checkpoint(self):
+        """
+        Abre V y policy mapeados en disco. Si progress.json corresponde a
+        este problema, los reutiliza y devuelve el último periodo completado;
+        si no, crea archivos nuevos y devuelve None.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        paths = self._checkpoint_paths()
+        self._checkpoint_key = SolutionCache.key_for_solver(self)
+        progress = None
+        if os.path.exists(paths['progress.json']):
+            with open(paths['progress.json']) as f:
+                progress = json.load(f)
+        if progress is not None and progress['key'] == self._checkpoint_key:
+            self.V = np.load(paths['V.npy'], mmap_mode='r+')
+            self.policy = np.load(paths['policy.npy'], mmap_mode='r+')
+            self.order_up_to_levels[:] = progress['order_up_to_levels']
+            self.reorder_points[:] = progress['reorder_points']
+            self.fallback_periods = list(progress['fallback_periods'])
+            self.converged_period = progress['converged_period']
+            return int(progress['completed_period'])
+
+        self.V = np.lib.format.open_memmap(paths['V.npy'], mode='w+', dtype=self.value_dtype,
+                                           shape=(self.T + 1, self.I_max + 1))
+        self.V[:] = np.inf
+        self.policy = np.lib.format.open_memmap(paths['policy.npy'], mode='w+', dtype=int,
+                                                shape=(self.T, self.I_max + 1))
+        return None
+
+    def _checkpoint(self, t: int):
+        """
+        Vuelca a disco las filas ya resueltas y registra t como el último
+        periodo completado (escritura atómica de progress.json).
+        """
+        if self.checkpoint_dir is None:
+            return
+        if self._checkpoint_key is None:
+            self._checkpoint_key = SolutionCache.key_for_solver(self)
+        self.V.flush()
+        self.policy.flush()
+        paths = self._checkpoint_paths()
+        progress = {
+            'key': self._checkpoint_key,
+            'completed_period': int(t),
+            'order_up_to_levels': self.order_up_to_levels.tolist(),
+            'reorder_points': self.reorder_points.tolist(),
+            'fallback_periods': [int(k) for k in self.fallback_periods],
+            'converged_period': self.converged_period,
+        }
+        tmp_path = paths['progress.json'] + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(progress, f)
+        os.replace(tmp_path, paths['progress.json'])
+
+    @property
+    def policy_model(self):
+        """
+        PolicyModel (s_t, S_t) de la última solución si todos los periodos
+        resultaron de umbral ('base_stock' o 'sS'); None en otro caso.
+        """
+        if np.any(self.order_up_to_levels < 0):
+            return None
+        return PolicyModel(self.reorder_points, self.order_up_to_levels, self.x_max, self.I_max)
+
+    def summary(self) -> list:
+        """
+        Resumen (s_t, S_t) por periodo de la última solución: el de
+        policy_model si existe (con costo fijo, x_max puede recortar el pedido
+        en s_t y la tabla no muestra S_t); si no, helpers.policy_summary.
+        """
+        policy_model = self.policy_model
+        if policy_model is not None:
+            return policy_model.summary()
+        return policy_summary(self.policy)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memoria ocupada por V y policy en bytes.
+        """
+        return self.V.nbytes + (self.policy.nbytes if self.policy is not None else 0)
+
+    def _row(self, t: int) -> int:
+        """
+        Fila de V que almacena V_t (en modo 'low' las filas se alternan).
+        """
+        return t if self.memory_mode == 'full' else t % 2
+
+    def _states(self, t: int) -> tuple[int, int]:
+        """
+        Intervalo [lo, hi] de niveles de inventario que se resuelven en t.
+        """
+        if self.reachable_bounds is None:
+            return 0, self.I_max
+        lo, hi = self.reachable_bounds[t]
+        return int(lo), int(hi)
+
+    def _clear_row(self, t: int):
+        """
+        Con poda, marca V_t como nan antes de resolver los estados alcanzables.
+        """
+        if self.reachable_bounds is not None:
+            self.V[self._row(t)] = np.nan
+
+    def _allocate_policy(self):
+        """
+        Tabla de política según el modo de memoria. En modo 'low' con
+        'base_stock' o 'sS' no se reserva (None) hasta que un periodo no sea
+        umbral.
+        """
+        if self.memory_mode == 'full':
+            return np.zeros((self.T, self.I_max + 1), dtype=int)
+        if self.method in ('base_stock', 'sS'):
+            return None
+        return np.zeros((self.T, self.I_max + 1), dtype=np.min_scalar_type(self.x_max))
+
+    def _store_period(self, t: int, V_row: np.ndarray, x_row: np.ndarray, S_t: int = None,
+                      s_t: int = None):
+        """
+        Guarda V_t y la política del periodo t sobre los estados [lo, hi] de
+        _states(t). (s_t, S_t) describen la política del periodo cuando tiene
+        forma de umbral (s_t = S_t - 1 si no se indica: nivel base).
+        """
+        lo, hi = self._states(t)
+        self.V[self._row(t), lo:hi + 1] = V_row
+        if S_t is not None:
+            self.order_up_to_levels[t] = S_t
+            self.reorder_points[t] = S_t - 1 if s_t is None else s_t
+        if self.policy is None:
+            if S_t is not None:
+                return
+            # Primer periodo no umbral: se materializan los periodos ya resueltos
+            self.policy = np.zeros((self.T, self.I_max + 1), dtype=np.min_scalar_type(self.x_max))
+            thresholds = PolicyModel(self.reorder_points, self.order_up_to_levels, self.x_max, self.I_max)
+            for k in range(t + 1, self.T):
+                lo_k, hi_k = self._states(k)
+                self.policy[k, lo_k:hi_k + 1] = thresholds.row(k)[lo_k:hi_k + 1]
+        self.policy[t, lo:hi + 1] = x_row
+
     def _solve_state(self, t: int, I: int):
         """
         Resuelve un estado (t, I) evaluando todas las acciones x.
@@ -62,7 +524,7 @@ class DynamicProgrammingSolver:
                 min_cost = cost
                 best_x = x
 
-        self.V[t, I] = min_cost
+        self.V[self._row(t), I] = min_cost
         self.policy[t, I] = best_x
 
     def _calculate_expected_cost(self, t: int, I: int, x: int) -> float:
@@ -75,12 +537,219 @@ class DynamicProgrammingSolver:
 
         for D, p_D in zip(support, probs):
             I_next = I + x - D
-            purchase_cost = self.costs[t] * x
+            purchase_cost = self.costs[t] * x + (self.K if x > 0 else 0)
             holding_cost = self.h * max(I_next, 0)
             shortage_cost = self.p * max(-I_next, 0)
 
             immediate = purchase_cost + holding_cost + shortage_cost
-            future = self.V[t + 1, max(I_next, 0)]
+            future = self.V[self._row(t + 1), max(I_next, 0)]
             total += p_D * (immediate + future)
 
         return total
+
+    def _solve_period_vectorized(self, t: int):
+        """
+        Resuelve todos los estados del periodo t a la vez.
+
+        El costo esperado se evalúa sobre la malla completa (I, x) con el
+        nivel de reposición y = I + x. La suma sobre D se acumula en el mismo
+        orden que _calculate_expected_cost, por lo que los resultados son
+        idénticos bit a bit (incluido el desempate por el menor x).
+        """
+        lo, hi = self._states(t)
+        chunks = self._map_chunks(lambda a, b: self._vectorized_chunk(t, a, b), lo, hi)
+        self._store_period(t, np.concatenate([v for v, _ in chunks]), np.concatenate([x for _, x in chunks]))
+
+    def _vectorized_chunk(self, t: int, a: int, b: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        V_t y política de los estados I = a..b-1 sobre la malla (I, x).
+        """
+        levels = np.arange(a, b)
+        orders = np.arange(self.x_max + 1)
+        y = levels[:, None] + orders[None, :]
+        feasible = y <= self.I_max
+
+        V_next = self.V[self._row(t + 1)]
+        purchase_cost = self.costs[t] * orders[None, :] + self.K * (orders[None, :] > 0)
+        total = np.zeros(y.shape)
+
+        for D, p_D in zip(self.demand_dist.get_support(), self.demand_dist.get_probabilities()):
+            I_next = y - D
+            holding_cost = self.h * np.maximum(I_next, 0)
+            shortage_cost = self.p * np.maximum(-I_next, 0)
+
+            immediate = purchase_cost + holding_cost + shortage_cost
+            future = V_next[np.clip(I_next, 0, self.I_max)]
+            total += p_D * (immediate + future)
+
+        total[~feasible] = np.inf
+        best_x = np.argmin(total, axis=1)
+        return total[np.arange(len(levels)), best_x], best_x
+
+    def _expected_period_cost(self, t: int) -> np.ndarray:
+        """
+        G_t(y) = L(y) + E[V_{t+1}(max(y - D, 0))] para y = 0..I_max.
+
+        Con poda, G_t solo es válido para y en [lo_t, min(hi_t + x_max, I_max)]:
+        los nan de V_{t+1} se anulan para no contaminar la convolución.
+        """
+        loss = self.cost_model.expected_loss(self.demand_dist, self.I_max)
+        V_next = self.V[self._row(t + 1)].astype(float)
+        if self.reachable_bounds is not None:
+            V_next[np.isnan(V_next)] = 0.0
+        return loss + self.cost_model.expected_future(V_next, self.demand_dist)
+
+    def _solve_period_order_up_to(self, t: int):
+        """
+        Resuelve el periodo t sobre el nivel de reposición y = I + x:
+            V_t(I) = min_{I ≤ y ≤ min(I + x_max, I_max)} c_t·y + G_t(y) - c_t·I
+        """
+        lo, hi = self._states(t)
+        H = self.costs[t] * np.arange(self.I_max + 1) + self._expected_period_cost(t)
+        if self.K:
+            V_row, x_row = self._fixed_cost_rows(t, H, lo, hi)
+            self._store_period(t, V_row, x_row)
+            return
+
+        def window_chunk(a, b):
+            # La ventana de I llega hasta I + x_max (o hasta el final de H)
+            best_x, best_H = window_argmin(H[a:b + self.x_max], self.x_max + 1)
+            return best_x[:b - a], best_H[:b - a]
+
+        chunks = self._map_chunks(window_chunk, lo, hi)
+        best_x = np.concatenate([x for x, _ in chunks])
+        best_H = np.concatenate([h for _, h in chunks])
+        self._store_period(t, best_H - self.costs[t] * np.arange(lo, hi + 1), best_x)
+
+    def _solve_period_base_stock(self, t: int):
+        """
+        Resuelve el periodo t con una política de nivel base S_t.
+
+        Si H(y) = c_t·y + G_t(y) es unimodal, el mínimo sobre la ventana
+        [I, min(I + x_max, I_max)] es y = max(I, min(S_t, I + x_max)), con
+        S_t el primer minimizador global de H. En caso contrario se enumera
+        la ventana completa y el periodo se registra en fallback_periods.
+        Con poda, H se examina solo en los niveles y alcanzables desde [lo, hi].
+        """
+        lo, hi = self._states(t)
+        y_hi = min(hi + self.x_max, self.I_max)
+        levels = np.arange(lo, hi + 1)
+        H_full = self.costs[t] * np.arange(self.I_max + 1) + self._expected_period_cost(t)
+        H = H_full[lo:y_hi + 1]
+        tol = 1e-9 * max(1.0, float(np.max(np.abs(H))))
+        if not is_unimodal(H):
+            self.fallback_periods.append(t)
+            best_x, best_H = window_argmin(H, self.x_max + 1)
+            n = hi - lo + 1
+            self._store_period(t, best_H[:n] - self.costs[t] * levels, best_x[:n])
+            return
+
+        S_t = lo + binary_search_minimum(H, tol)
+        y = np.maximum(levels, np.minimum(S_t, levels + self.x_max))
+        self._store_period(t, H_full[y] - self.costs[t] * levels, y - levels, S_t)
+
+    def _solve_coarse(self, c: np.ndarray, t_start: int):
+        """
+        Resuelve la malla gruesa: una unidad gruesa son coarse_step unidades,
+        con costos por unidad gruesa y demanda en cubetas.
+        """
+        k = self.coarse_step
+        self.coarse_solver = DynamicProgrammingSolver(
+            self.T, self.I_max // k, self.x_max // k,
+            {'c': c * k, 'h': self.h * k, 'p': self.p * k},
+            bucket_demand(self.demand_dist, k), method='base_stock'
+        )
+        V_coarse, policy_coarse = self.coarse_solver.solve()
+        self._coarse_grid = k * np.arange(V_coarse.shape[1])
+
+        # Nivel base grueso de cada periodo (en unidades finas)
+        centers = []
+        summary = policy_summary(policy_coarse)
+        for t, S_t in enumerate(self.coarse_solver.order_up_to_levels):
+            if S_t < 0:
+                S_t = summary[t][1] or 0
+            centers.append(k * int(S_t))
+        self._band_centers = centers
+        if self.approximation_gap is None or len(self.approximation_gap) != self.T:
+            self.approximation_gap = np.zeros(self.T)
+        self.band_edge_periods = [t for t in self.band_edge_periods if t > t_start]
+
+    def _solve_period_multigrid(self, t: int):
+        """
+        Resuelve el periodo t de forma exacta en todos los estados, buscando
+        el nivel base solo en la banda [S - band, S + band] alrededor del
+        nivel base grueso S.
+
+        H(y) = c_t·y + G_t(y) se calcula en la malla fina. Si H es unimodal y
+        su mínimo en la banda no cae en un borde interior, es el primer
+        minimizador global y la regla de nivel base da el mínimo exacto de
+        cada ventana. Si no, se enumera la ventana completa como
+        'order_up_to' y el periodo se registra en band_edge_periods.
+        """
+        levels = np.arange(self.I_max + 1)
+        H = self.costs[t] * levels + self._expected_period_cost(t)
+
+        center = self._band_centers[t]
+        band_lo = max(center - self.band, 0)
+        band_hi = min(center + self.band, self.I_max)
+        S_t = band_lo + int(np.argmin(H[band_lo:band_hi + 1]))
+        on_edge = (S_t == band_lo and band_lo > 0) or (S_t == band_hi and band_hi < self.I_max)
+
+        if on_edge or not is_unimodal(H):
+            self.band_edge_periods.append(t)
+            best_x, best_H = window_argmin(H, self.x_max + 1)
+            V_row, x_row, S_t = best_H - self.costs[t] * levels, best_x, None
+        else:
+            y = np.maximum(levels, np.minimum(S_t, levels + self.x_max))
+            V_row, x_row = H[y] - self.costs[t] * levels, y - levels
+
+        band = slice(band_lo, band_hi + 1)
+        V_coarse = np.interp(levels[band], self._coarse_grid, self.coarse_solver.V[t])
+        self.approximation_gap[t] = float(np.max(np.abs(V_row[band] - V_coarse)))
+        self._store_period(t, V_row, x_row, S_t)
+
+    def _fixed_cost_rows(self, t: int, H: np.ndarray, lo: int, hi: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Mínimo exacto con costo fijo para I = lo..hi:
+            V_t(I) = min(H(I), K + min_{I < y ≤ min(I + x_max, I_max)} H(y)) - c_t·I
+        Sin pedido en caso de empate (como la enumeración, que evalúa x = 0 primero).
+        """
+        levels = np.arange(lo, hi + 1)
+        n = hi - lo + 1
+        # Ventanas [I+1, I+x_max]; la de I_max queda vacía (+inf)
+        shifted = np.append(H[lo + 1:], np.inf)
+        offset, best = sparse_window_argmin(shifted, self.x_max)
+        order_cost = self.K + best[:n]
+        no_order = H[lo:hi + 1]
+        order = order_cost < no_order
+        x_row = np.where(order, offset[:n] + 1, 0)
+        return np.where(order, order_cost, no_order) - self.costs[t] * levels, x_row
+
+    def _solve_period_sS(self, t: int):
+        """
+        Resuelve el periodo t con una política (s_t, S_t) obtenida por
+        K-convexidad; con verify_sS se contrasta con el mínimo exacto.
+        """
+        lo, hi = self._states(t)
+        y_hi = min(hi + self.x_max, self.I_max)
+        levels = np.arange(lo, hi + 1)
+        H = self.costs[t] * np.arange(self.I_max + 1) + self._expected_period_cost(t)
+
+        # S_t: primer minimizador de H; s_t: mayor I < S_t con H(I) > K + H(S_t)
+        S_t = lo + int(np.argmin(H[lo:y_hi + 1]))
+        below = np.flatnonzero(H[lo:S_t] > self.K + H[S_t])
+        s_t = lo + int(below[-1]) if len(below) else -1
+        x_sS = np.where(levels <= s_t, np.clip(np.minimum(S_t - levels, self.x_max), 0, None), 0)
+
+        cost_sS = np.where(x_sS > 0, self.K + H[levels + x_sS], H[levels]) - self.costs[t] * levels
+        if not self.verify_sS:
+            self._store_period(t, cost_sS, x_sS, S_t, s_t)
+            return
+
+        V_row, x_row = self._fixed_cost_rows(t, H, lo, hi)
+        tol = 1e-9 * max(1.0, float(np.max(np.abs(V_row))))
+        if np.all(cost_sS <= V_row + tol):
+            self._store_period(t, cost_sS, x_sS, S_t, s_t)
+        else:
+            self.fallback_periods.append(t)
+            self._store_period(t, V_row, x_row)
@@ -0,0 +1,119 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.models.demand_model import DemandModel
+
+EXPERIMENT_OUTPUTS = ('V0', 'solution_time', 'policy_summary', 'memory_bytes')
+
+
+def make_instance(T, I_max, x_max, costs: dict, support, probs, I_init: int = 0,
+                  method: str = 'vectorized', repeats: int = 1, warmup: bool = False,
+                  **solver_options) -> dict:
+    """
+    Construye la especificación (serializable) de una instancia DP.
+
+    Args:
+        T, I_max, x_max: Dimensiones del problema
+        costs: Dict con {'c': secuencia c_t, 'h': float, 'p': float} y
+            opcionalmente 'K' (costo fijo por pedido)
+        support, probs: Distribución discreta de la demanda
+        I_init: Inventario inicial para V0
+        method: Motor de DynamicProgrammingSolver
+        repeats: Número de resoluciones cronometradas (se promedia el tiempo)
+        warmup: Si True, resuelve una vez antes de cronometrar
+        solver_options: Argumentos adicionales de DynamicProgrammingSolver
+            (p.ej. memory_mode='low')
+    """
+    return {
+        'T': int(T), 'I_max': int(I_max), 'x_max': int(x_max),
+        'costs': {'c': np.asarray(costs['c']), 'h': costs['h'], 'p': costs['p'], 'K': costs.get('K', 0)},
+        'support': np.asarray(support), 'probs': np.asarray(probs),
+        'I_init': int(I_init), 'method': method,
+        'repeats': int(repeats), 'warmup': bool(warmup),
+        'solver_options': solver_options,
+    }
+
+
+def solve_instance(instance: dict, outputs=('V0', 'solution_time')) -> dict:
+    """
+    Resuelve una instancia y devuelve solo las salidas pedidas:
+        'V0': V[0, I_init]
+        'solution_time': tiempo medio de solve() en segundos
+        'policy_summary': lista de (s_t, S_t) por periodo
+        'memory_bytes': memoria ocupada por V y policy (solver.nbytes)
+    """
+    unknown = set(outputs) - set(EXPERIMENT_OUTPUTS)
+    if unknown:
+        raise ValueError(f"Salidas desconocidas: {sorted(unknown)} (opciones: {EXPERIMENT_OUTPUTS}).")
+
+    solver = DynamicProgrammingSolver(
+        T=instance['T'],
+        I_max=instance['I_max'],
+        x_max=instance['x_max'],
+        costs=instance['costs'],
+        demand_dist=DemandModel(instance['support'], instance['probs']),
+        method=instance.get('method', 'vectorized'),
+        **instance.get('solver_options', {})
+    )
+    if instance.get('warmup'):
+        solver.solve()
+    times = []
+    for _ in range(max(instance.get('repeats', 1), 1)):
+        start = time.perf_counter()
+        V, policy = solver.solve()
+        times.append(time.perf_counter() - start)
+
+    available = {
+        'V0': lambda: float(V[0, instance.get('I_init', 0)]),
+        'solution_time': lambda: float(np.mean(times)),
+        'policy_summary': solver.summary,
+        'memory_bytes': lambda: int(solver.nbytes),
+    }
+    return {name: available[name]() for name in outputs}
+
+
+def _solve_chunk(args):
+    instances, outputs = args
+    return [solve_instance(instance, outputs) for instance in instances]
+
+
+def run_instances(instances, outputs=('V0', 'solution_time'), max_workers=1, chunksize=None) -> list[dict]:
+    """
+    Resuelve instancias independientes en un ProcessPoolExecutor.
+
+    Las instancias se agrupan en bloques de `chunksize` para amortizar la
+    serialización y los resultados se devuelven en el mismo orden de
+    entrada. Solo viajan de vuelta las salidas pedidas, no las tablas V.
+
+    Args:
+        instances: Lista de dicts creados con make_instance()
+        outputs: Salidas a devolver (ver solve_instance)
+        max_workers: Procesos a usar (1 = en serie, por defecto; None = os.cpu_count()).
+            Con varios procesos la contención de CPU y ancho de banda de
+            memoria distorsiona solution_time: use paralelismo solo cuando
+            no se midan tiempos
+        chunksize: Instancias por tarea (None = reparto en ~4 bloques por proceso)
+    """
+    instances = list(instances)
+    outputs = tuple(outputs)
+    if not instances:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        return _solve_chunk((instances, outputs))
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(instances) / (workers * 4)))
+    chunks = [(instances[i:i + chunksize], outputs) for i in range(0, len(instances), chunksize)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for chunk_results in executor.map(_solve_chunk, chunks):
+            results.extend(chunk_results)
+    return results
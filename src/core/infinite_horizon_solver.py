@@ -0,0 +1,154 @@
+import time
+import warnings
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from src.models.cost_model import CostModel, demand_pmf
+from src.utils.mathematical_utils import window_argmin
+
+
+class InfiniteHorizonSolver:
+    """
+    Problema de inventario estacionario con horizonte infinito y descuento β:
+
+        V(I) = min_{I ≤ y ≤ min(I + x_max, I_max)} c·(y - I) + L(y) + β·E[V(max(y - D, 0))]
+
+    Mismos estados, acciones y demanda que DynamicProgrammingSolver. Se
+    itera valor con regla de parada por span y, cuando la política deja de
+    cambiar, se pasa a iteración de políticas: la evaluación resuelve el
+    sistema disperso (I - β·P_π)·V = r_π.
+    """
+
+    def __init__(self, I_max, x_max, costs: dict, demand_dist, discount: float = 0.95,
+                 tol: float = 1e-6, max_iterations: int = 10_000, switch_after: int = 3,
+                 max_policy_iterations: int = 100):
+        """
+        Args:
+            I_max: Nivel máximo de inventario
+            x_max: Cantidad máxima de orden
+            costs: Dict con {'c': costo unitario (escalar o secuencia constante), 'h', 'p'}
+            demand_dist: Objeto con métodos get_support() y get_probabilities()
+            discount: Factor de descuento β en (0, 1)
+            tol: Tolerancia ε: V queda a menos de ε del óptimo al parar por span
+            max_iterations: Máximo de barridos de iteración de valor
+            switch_after: Barridos consecutivos con la misma política antes de
+                pasar a iteración de políticas (None: solo iteración de valor)
+            max_policy_iterations: Máximo de pasos de iteración de políticas; si
+                se alcanza (p. ej. la política cicla por redondeo) se emite un
+                RuntimeWarning y se devuelve la última política evaluada con
+                converged = False
+        """
+        if not 0 < discount < 1:
+            raise ValueError(f"El factor de descuento debe estar en (0, 1) (es {discount}).")
+        if costs.get('K', 0):
+            raise ValueError("El horizonte infinito no admite costo fijo K.")
+        c = np.unique(np.asarray(costs['c'], dtype=float))
+        if len(c) != 1:
+            raise ValueError("El horizonte infinito requiere un costo c constante.")
+
+        self.I_max = int(I_max)
+        self.x_max = int(x_max)
+        self.c = float(c[0])
+        self.h = costs['h']
+        self.p = costs['p']
+        self.demand_dist = demand_dist
+        self.discount = float(discount)
+        self.tol = float(tol)
+        self.max_iterations = int(max_iterations)
+        self.switch_after = switch_after
+        self.max_policy_iterations = int(max_policy_iterations)
+        self.cost_model = CostModel(self.h, self.p)
+
+        self.V = np.zeros(self.I_max + 1)
+        self.policy = np.zeros(self.I_max + 1, dtype=int)
+        self.iterations = 0
+        self.policy_iterations = 0
+        self.converged = False
+        self.solution_time = 0.0
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve (V, policy): vector de valor y fila de política estacionaria
+        de longitud I_max + 1.
+        """
+        start = time.time()
+        self.iterations = 0
+        self.policy_iterations = 0
+        self.converged = False
+
+        V = np.zeros(self.I_max + 1)
+        policy = None
+        stable = 0
+        # Cota de parada por span: sp(V_{n+1} - V_n) < ε·(1 - β)/β
+        span_tol = self.tol * (1 - self.discount) / self.discount
+
+        while self.iterations < self.max_iterations:
+            V_new, x = self._bellman(V)
+            self.iterations += 1
+            diff = V_new - V
+            stable = stable + 1 if policy is not None and np.array_equal(x, policy) else 0
+            policy = x
+
+            if diff.max() - diff.min() < span_tol:
+                # Extrapolación con las cotas de MacQueen
+                V = V_new + self.discount / (1 - self.discount) * (diff.max() + diff.min()) / 2
+                self.converged = True
+                break
+            V = V_new
+            if self.switch_after is not None and stable >= self.switch_after:
+                V, policy, self.converged = self._policy_iteration(policy)
+                break
+
+        self.V, self.policy = V, policy
+        self.solution_time = time.time() - start
+        return self.V, self.policy
+
+    def _bellman(self, V: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Un barrido del operador de Bellman. Devuelve (T·V, política greedy).
+        """
+        levels = np.arange(self.I_max + 1)
+        H = (self.c * levels
+             + self.cost_model.expected_loss(self.demand_dist, self.I_max)
+             + self.discount * self.cost_model.expected_future(V, self.demand_dist))
+        best_x, best_H = window_argmin(H, self.x_max + 1)
+        return best_H - self.c * levels, best_x
+
+    def _policy_iteration(self, policy: np.ndarray) -> tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Evalúa la política exactamente y la mejora hasta que no cambie o se
+        alcance max_policy_iterations. Devuelve (V, policy, convergió).
+        """
+        while self.policy_iterations < self.max_policy_iterations:
+            self.policy_iterations += 1
+            V = self.evaluate(policy)
+            _, improved = self._bellman(V)
+            if np.array_equal(improved, policy):
+                return V, policy, True
+            policy = improved
+        warnings.warn(
+            f"La iteración de políticas no convergió en {self.max_policy_iterations} pasos.",
+            RuntimeWarning
+        )
+        return self.evaluate(policy), policy, False
+
+    def evaluate(self, policy) -> np.ndarray:
+        """
+        Valor descontado de una política estacionaria x = policy[I], resolviendo
+        (I - β·P_π)·V = r_π con r_π(I) = c·x + L(I + x).
+        """
+        policy = np.asarray(policy, dtype=int)
+        levels = np.arange(self.I_max + 1)
+        y = levels + policy
+        reward = self.c * policy + self.cost_model.expected_loss(self.demand_dist, self.I_max)[y]
+
+        pmf = demand_pmf(self.demand_dist)
+        demands = np.flatnonzero(pmf)
+        rows = np.repeat(levels, len(demands))
+        cols = np.maximum(y[:, None] - demands[None, :], 0).reshape(-1)
+        data = np.tile(pmf[demands], len(levels))
+        n = self.I_max + 1
+        P = sparse.csr_matrix((data, (rows, cols)), shape=(n, n))
+        return spsolve((sparse.identity(n, format='csr') - self.discount * P).tocsc(), reward)
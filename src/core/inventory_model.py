@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class InventoryModel:
     """
     Modelo de inventario según sección 1.2 del informe:
@@ -30,3 +33,23 @@ class InventoryModel:
         Garantiza nivel no negativo: max(0, ...).
         """
         return max(I + x - D, 0)
+
+    def reachable_intervals(self, T: int, demand_support) -> np.ndarray:
+        """
+        Intervalos [lo_t, hi_t] de niveles alcanzables desde I_init en los
+        periodos t = 0..T, con pedidos 0 ≤ x ≤ x_max, I + x ≤ I_max y
+        demandas del soporte dado (cota por intervalo del conjunto alcanzable).
+
+        Returns:
+            np.ndarray de forma (T+1, 2)
+        """
+        d_min = int(np.min(demand_support))
+        d_max = int(np.max(demand_support))
+        lo = hi = int(self.I_init)
+        bounds = np.empty((int(T) + 1, 2), dtype=int)
+        bounds[0] = lo, hi
+        for t in range(1, int(T) + 1):
+            lo = max(lo - d_max, 0)
+            hi = max(min(hi + self.x_max, self.I_max) - d_min, 0)
+            bounds[t] = lo, hi
+        return bounds
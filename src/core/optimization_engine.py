@@ -1,4 +1,5 @@
 from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.infinite_horizon_solver import InfiniteHorizonSolver
 from src.models.cost_model import CostModel
 from src.models.demand_model import DemandModel
 from src.core.inventory_model import InventoryModel
@@ -19,7 +20,14 @@ class OptimizationEngine:
                  h: float,
                  p: float,
                  demand_support: list[int],
-                 demand_prob: list[float]):
+                 demand_prob: list[float],
+                 K: float = 0,
+                 method: str = 'vectorized',
+                 cache=None,
+                 prune_unreachable: bool = False,
+                 stationary_tol: float = None,
+                 checkpoint_dir: str = None,
+                 verify_sS: bool = False):
         """
         Args:
             I_init: Inventario inicial
@@ -31,20 +39,42 @@ class OptimizationEngine:
             p: Costo de penalización por escasez
             demand_support: Valores discretos d_i de demanda
             demand_prob: Probabilidades p_i (suman 1)
+            K: Costo fijo por pedido (con K > 0 use method='sS' u 'order_up_to')
+            method: Motor del solver (ver SOLVER_METHODS en dynamic_programming_solver)
+            cache: SolutionCache opcional; si contiene la solución no se resuelve
+            prune_unreachable: Resolver solo los estados alcanzables desde I_init
+                (V = nan en los demás)
+            stationary_tol: Tolerancia de detección de política estacionaria
+                (ver DynamicProgrammingSolver)
+            checkpoint_dir: Directorio para resolver sobre archivos mapeados en
+                memoria con reanudación; run() devuelve entonces arreglos
+                np.memmap y no usa la caché
+            verify_sS: Con method='sS', verificar cada periodo contra el mínimo
+                exacto (ver DynamicProgrammingSolver)
         """
         # Modelos
         self.inventory_model = InventoryModel(I_init, I_max, x_max)
         self.cost_model = CostModel(h, p)
         self.demand_model = DemandModel(demand_support, demand_prob)
 
+        self.cache = cache
+
         # Parámetros del solver
         costs = {'c': c_ts, 'h': h, 'p': p}
+        if K:
+            costs['K'] = K
+        self.costs = costs
         self.solver = DynamicProgrammingSolver(
             T=horizon,
             I_max=I_max,
             x_max=x_max,
             costs=costs,
-            demand_dist=self.demand_model
+            demand_dist=self.demand_model,
+            method=method,
+            I_init=I_init if prune_unreachable else None,
+            stationary_tol=stationary_tol,
+            checkpoint_dir=checkpoint_dir,
+            verify_sS=verify_sS
         )
 
     def run(self):
@@ -53,5 +83,26 @@ class OptimizationEngine:
             V: matriz de función de valor de tamaño (T+1)×(I_max+1)
             policy: matriz de política óptima de tamaño T×(I_max+1)
         """
+        if self.cache is not None and self.solver.checkpoint_dir is None:
+            return self.cache.solve(self.solver)
         V, policy = self.solver.solve()
-        return V, policy
\ No newline at end of file
+        return V, policy
+
+    def run_infinite_horizon(self, discount: float = 0.95, **options):
+        """
+        Resuelve la versión estacionaria descontada del mismo problema
+        (requiere c_t constante). options se pasan a InfiniteHorizonSolver.
+
+        Returns:
+            V: vector de valor de tamaño I_max+1
+            policy: fila de política estacionaria de tamaño I_max+1
+        """
+        self.infinite_horizon_solver = InfiniteHorizonSolver(
+            I_max=self.inventory_model.I_max,
+            x_max=self.inventory_model.x_max,
+            costs=self.costs,
+            demand_dist=self.demand_model,
+            discount=discount,
+            **options
+        )
+        return self.infinite_horizon_solver.solve()
@@ -0,0 +1,129 @@
+import numpy as np
+
+from src.models.cost_model import CostModel, demand_pmf
+
+
+class PolicyEvaluator:
+    """
+    Evaluación exacta (sin muestreo) de una política tabular x = policy[t, I].
+
+    Con la política fija, el inventario es una cadena de Markov finita: la
+    distribución de I_t se propaga hacia adelante desde I_init y los costos
+    esperados por periodo se obtienen con las tablas de CostModel.
+    """
+
+    def __init__(self, policy, costs: dict, demand_dist, I_init: int = 0):
+        """
+        Args:
+            policy: Arreglo T×(I_max+1) con la cantidad a pedir por estado
+            costs: Dict con {'c': secuencia de costos c_t, 'h': float, 'p': float}
+                y opcionalmente 'K': costo fijo por pedido
+            demand_dist: Objeto con métodos get_support() y get_probabilities()
+            I_init: Inventario inicial
+        """
+        self.policy = np.asarray(policy)
+        self.T, n_states = self.policy.shape
+        self.I_max = n_states - 1
+        self.c = np.broadcast_to(np.asarray(costs['c'], dtype=float), (self.T,))
+        self.h = costs['h']
+        self.p = costs['p']
+        self.K = costs.get('K', 0)
+        self.demand_dist = demand_dist
+        self.I_init = int(I_init)
+        self.cost_model = CostModel(self.h, self.p)
+
+    def _order_up_to(self, t: int) -> np.ndarray:
+        levels = np.arange(self.I_max + 1)
+        return np.minimum(levels + self.policy[t].astype(np.int64), self.I_max)
+
+    def _transition(self, distribution: np.ndarray, y: np.ndarray, pmf: np.ndarray) -> np.ndarray:
+        next_distribution = np.zeros_like(distribution)
+        for d in np.flatnonzero(pmf):
+            next_distribution += pmf[d] * np.bincount(np.maximum(y - d, 0), weights=distribution,
+                                                      minlength=self.I_max + 1)
+        return next_distribution
+
+    def evaluate(self) -> dict:
+        """
+        Returns:
+            Dict con:
+                'state_distribution': P(I_t = I), forma (T+1, I_max+1)
+                'purchase_cost', 'holding_cost', 'shortage_cost': costos
+                    esperados por periodo, forma (T,)
+                'total_cost': costo total esperado
+        """
+        tables = self.cost_model.demand_tables(self.demand_dist, self.I_max)
+        pmf = tables['pmf']
+
+        distribution = np.zeros((self.T + 1, self.I_max + 1))
+        distribution[0, self.I_init] = 1.0
+        purchase = np.zeros(self.T)
+        holding = np.zeros(self.T)
+        shortage = np.zeros(self.T)
+
+        for t in range(self.T):
+            y = self._order_up_to(t)
+            orders = y - np.arange(self.I_max + 1)
+            purchase[t] = np.dot(distribution[t], self.c[t] * orders + self.K * (orders > 0))
+            holding[t] = self.h * np.dot(distribution[t], tables['excess'][y])
+            shortage[t] = self.p * np.dot(distribution[t], tables['shortfall'][y])
+            distribution[t + 1] = self._transition(distribution[t], y, pmf)
+
+        return {
+            'state_distribution': distribution,
+            'purchase_cost': purchase,
+            'holding_cost': holding,
+            'shortage_cost': shortage,
+            'total_cost': float(purchase.sum() + holding.sum() + shortage.sum()),
+        }
+
+    def cost_distribution(self, bucket_width: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Distribución exacta del costo total sobre cubetas de ancho bucket_width.
+
+        Se propaga la distribución conjunta de (I_t, costo acumulado); el costo
+        de cada periodo se redondea a la cubeta más cercana, por lo que el
+        error de discretización es a lo sumo T·bucket_width/2.
+
+        Returns:
+            (values, probabilities): centros de cubeta y su probabilidad
+        """
+        pmf = demand_pmf(self.demand_dist)
+        levels = np.arange(self.I_max + 1)
+        demands = np.flatnonzero(pmf)
+
+        # Desplazamiento (en cubetas) por estado y demanda en cada periodo
+        shifts = []
+        for t in range(self.T):
+            y = self._order_up_to(t)
+            I_next = y[:, None] - demands[None, :]
+            cost = ((self.c[t] * (y - levels) + self.K * (y > levels))[:, None]
+                    + self.h * np.maximum(I_next, 0) + self.p * np.maximum(-I_next, 0))
+            shifts.append((y, np.rint(cost / bucket_width).astype(np.int64)))
+        n_buckets = 1 + sum(int(k.max()) for _, k in shifts)
+
+        joint = np.zeros((self.I_max + 1, n_buckets))
+        joint[self.I_init, 0] = 1.0
+        for y, k in shifts:
+            states = np.flatnonzero(joint.any(axis=1))
+            used = np.flatnonzero(joint[states].any(axis=0))
+            width = used[-1] + 1
+            next_joint = np.zeros_like(joint)
+            for j, d in enumerate(demands):
+                rows = np.maximum(y[states] - d, 0)
+                cols = k[states, j][:, None] + np.arange(width)[None, :]
+                np.add.at(next_joint, (rows[:, None], cols), pmf[d] * joint[states, :width])
+            joint = next_joint
+
+        probabilities = joint.sum(axis=0)
+        return np.arange(n_buckets) * bucket_width, probabilities
+
+
+def value_at_risk(values: np.ndarray, probabilities: np.ndarray, alpha: float) -> float:
+    """
+    VaR_α de una distribución discreta: menor valor v con P(C ≤ v) ≥ α.
+    """
+    order = np.argsort(values)
+    cdf = np.cumsum(np.asarray(probabilities)[order])
+    index = min(int(np.searchsorted(cdf, alpha - 1e-12)), len(cdf) - 1)
+    return float(np.asarray(values)[order][index])
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class PolicySimulator:
+    """
+    Simulación Monte Carlo de una política tabular x = policy[t, I].
+
+    Avanza todas las trayectorias a la vez en cada periodo: la demanda se
+    muestrea en bloque con un numpy.random.Generator, la acción se obtiene
+    por indexación avanzada y los costos se acumulan en arreglos.
+    """
+
+    def __init__(self, policy, costs: dict, demand_dist, I_init: int = 0, seed=None):
+        """
+        Args:
+            policy: Arreglo T×(I_max+1) con la cantidad a pedir por estado
+            costs: Dict con {'c': secuencia de costos c_t, 'h': float, 'p': float}
+                y opcionalmente 'K': costo fijo por pedido
+            demand_dist: Objeto con métodos get_support() y get_probabilities()
+            I_init: Inventario inicial de todas las trayectorias
+            seed: Semilla o numpy.random.Generator
+        """
+        self.policy = np.asarray(policy)
+        self.T = self.policy.shape[0]
+        self.c = np.broadcast_to(np.asarray(costs['c'], dtype=float), (self.T,))
+        self.h = costs['h']
+        self.p = costs['p']
+        self.K = costs.get('K', 0)
+        self.support = np.asarray(demand_dist.get_support())
+        self.probs = np.asarray(demand_dist.get_probabilities(), dtype=float)
+        self.I_init = int(I_init)
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+    def simulate(self, n_paths: int, batch_size: int = 1_000_000) -> dict:
+        """
+        Simula n_paths trayectorias (en bloques de batch_size para acotar memoria).
+
+        Returns:
+            Dict con:
+                'total_cost': costo total por trayectoria, forma (n_paths,)
+                'purchase_cost', 'holding_cost', 'shortage_cost': costo medio
+                    por periodo, forma (T,)
+                'mean_order', 'mean_inventory': pedido e inventario inicial
+                    medios por periodo, forma (T,)
+        """
+        n_paths = int(n_paths)
+        total_cost = np.empty(n_paths)
+        breakdown = {key: np.zeros(self.T) for key in
+                     ('purchase_cost', 'holding_cost', 'shortage_cost', 'mean_order', 'mean_inventory')}
+
+        for start in range(0, n_paths, batch_size):
+            n = min(batch_size, n_paths - start)
+            I = np.full(n, self.I_init, dtype=np.int64)
+            total = np.zeros(n)
+            for t in range(self.T):
+                x = self.policy[t, I].astype(np.int64)
+                D = self.rng.choice(self.support, size=n, p=self.probs)
+                I_next = I + x - D
+
+                purchase = self.c[t] * x + self.K * (x > 0)
+                holding = self.h * np.maximum(I_next, 0)
+                shortage = self.p * np.maximum(-I_next, 0)
+                total += purchase + holding + shortage
+
+                breakdown['purchase_cost'][t] += purchase.sum()
+                breakdown['holding_cost'][t] += holding.sum()
+                breakdown['shortage_cost'][t] += shortage.sum()
+                breakdown['mean_order'][t] += x.sum()
+                breakdown['mean_inventory'][t] += I.sum()
+                I = np.maximum(I_next, 0)
+            total_cost[start:start + n] = total
+
+        result = {key: value / max(n_paths, 1) for key, value in breakdown.items()}
+        result['total_cost'] = total_cost
+        return result
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from config import SOLUTION_CACHE_DIR, SOLUTION_CACHE_MAX_BYTES
+
+
+class SolutionCache:
+    """
+    Caché de soluciones (V, policy) direccionada por contenido.
+
+    La clave es un hash canónico de los parámetros del problema y del modo
+    del solver. Tiene un nivel en memoria (LRU con desalojo por tamaño en
+    bytes) y un nivel opcional en disco con V y policy como archivos .npy.
+    Junto a cada solución se guardan los umbrales (s_t, S_t) del solver
+    (THRESHOLD_FIELDS), de modo que un acierto reproduce también su
+    policy_model.
+    """
+
+    # Atributos del solver que describen la política por umbrales
+    THRESHOLD_FIELDS = ('reorder_points', 'order_up_to_levels', 'fallback_periods')
+
+    def __init__(self, max_bytes: int = SOLUTION_CACHE_MAX_BYTES, directory: str = None):
+        """
+        Args:
+            max_bytes: Tamaño máximo del nivel en memoria
+            directory: Directorio del nivel en disco (None = sin disco)
+        """
+        self.max_bytes = int(max_bytes)
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(T, I_max, x_max, c, h, p, support, probabilities, mode='vectorized') -> str:
+        """
+        Hash SHA-256 canónico de (T, I_max, x_max, c_t, h, p, demanda, modo).
+        """
+        digest = hashlib.sha256()
+        header = {'T': int(T), 'I_max': int(I_max), 'x_max': int(x_max),
+                  'h': float(h), 'p': float(p), 'mode': mode}
+        digest.update(json.dumps(header, sort_keys=True).encode())
+        for values in (c, support, probabilities):
+            digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+            digest.update(b'|')
+        return digest.hexdigest()
+
+    @classmethod
+    def key_for_solver(cls, solver) -> str:
+        """
+        Clave de caché de un DynamicProgrammingSolver.
+        """
+        mode = f"{solver.method}:{solver.memory_mode}:{solver.value_dtype.name}"
+        if solver.I_init is not None:
+            mode += f":I_init={solver.I_init}"
+        if solver.method == 'multigrid':
+            mode += f":coarse_step={solver.coarse_step}:band={solver.band}"
+        if solver.K:
+            mode += f":K={solver.K!r}"
+        if solver.method == 'sS' and solver.verify_sS:
+            mode += ":verify_sS"
+        if solver.stationary_tol is not None:
+            mode += f":stationary_tol={solver.stationary_tol!r}"
+        return cls.make_key(
+            solver.T, solver.I_max, solver.x_max,
+            np.broadcast_to(np.asarray(solver.costs, dtype=float), (solver.T,)),
+            solver.h, solver.p,
+            solver.demand_dist.get_support(), solver.demand_dist.get_probabilities(),
+            mode
+        )
+
+    def solve(self, solver):
+        """
+        Devuelve (V, policy) de la caché o resuelve y guarda. En un acierto,
+        solver.solution_time conserva el tiempo de la resolución original y
+        se restauran los umbrales (s_t, S_t) y fallback_periods.
+        """
+        key = self.key_for_solver(solver)
+        cached = self.get(key)
+        if cached is not None:
+            solver.V, solver.policy, solver.solution_time, thresholds = cached
+            # Entradas sin umbrales (anteriores o de put() sin thresholds): ninguno
+            if len(thresholds['order_up_to_levels']) == solver.T:
+                solver.reorder_points = np.array(thresholds['reorder_points'], dtype=int)
+                solver.order_up_to_levels = np.array(thresholds['order_up_to_levels'], dtype=int)
+            else:
+                solver.reorder_points = np.full(solver.T, -1, dtype=int)
+                solver.order_up_to_levels = np.full(solver.T, -1, dtype=int)
+            solver.fallback_periods = list(thresholds['fallback_periods'])
+            return solver.V, solver.policy
+
+        V, policy = solver.solve()
+        thresholds = {name: np.asarray(getattr(solver, name)).tolist() for name in self.THRESHOLD_FIELDS}
+        self.put(key, V, policy, solver.solution_time, thresholds)
+        return V, policy
+
+    def get(self, key: str):
+        """
+        Devuelve (V, policy, solution_time, thresholds) o None si no está en caché.
+        Los arreglos devueltos son de solo lectura.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def put(self, key: str, V, policy, solution_time: float, thresholds: dict = None):
+        """
+        Guarda una solución en memoria y, si hay directorio, en disco.
+        thresholds: listas THRESHOLD_FIELDS del solver (vacías si no se indican).
+        """
+        if thresholds is None:
+            thresholds = {name: [] for name in self.THRESHOLD_FIELDS}
+        V = np.array(V)
+        policy = np.array(policy)
+        V.flags.writeable = False
+        policy.flags.writeable = False
+        entry = (V, policy, float(solution_time), thresholds)
+        with self._lock:
+            self._insert(key, entry)
+        self._store(key, entry)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def clear(self):
+        """
+        Vacía el nivel en memoria y reinicia los contadores.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+
+    def _insert(self, key, entry):
+        if key in self._entries:
+            self._bytes -= self._size(self._entries.pop(key))
+        size = self._size(entry)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._size(evicted)
+
+    @staticmethod
+    def _size(entry) -> int:
+        return entry[0].nbytes + entry[1].nbytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _load(self, key: str):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, 'meta.json')) as fh:
+                meta = json.load(fh)
+            V = np.load(os.path.join(path, 'V.npy'))
+            policy = np.load(os.path.join(path, 'policy.npy'))
+        except (OSError, ValueError):
+            return None
+        V.flags.writeable = False
+        policy.flags.writeable = False
+        thresholds = {name: meta.get(name, []) for name in self.THRESHOLD_FIELDS}
+        return V, policy, float(meta['solution_time']), thresholds
+
+    def _store(self, key: str, entry):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        if os.path.isdir(path):
+            return
+        tmp = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        os.makedirs(tmp, exist_ok=True)
+        np.save(os.path.join(tmp, 'V.npy'), entry[0])
+        np.save(os.path.join(tmp, 'policy.npy'), entry[1])
+        with open(os.path.join(tmp, 'meta.json'), 'w') as fh:
+            json.dump({'solution_time': entry[2], **entry[3]}, fh)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # Otro proceso guardó la misma solución primero
+            for name in os.listdir(tmp):
+                os.remove(os.path.join(tmp, name))
+            os.rmdir(tmp)
+
+
+_default_cache = None
+
+
+def get_default_cache() -> SolutionCache:
+    """
+    Caché compartida por el proceso, configurada desde config.py.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SolutionCache(SOLUTION_CACHE_MAX_BYTES, SOLUTION_CACHE_DIR)
+    return _default_cache
@@ -1,11 +1,17 @@
+import io
 import os
+import zlib
 from datetime import datetime
+import numpy as np
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, DateTime, Text, JSON, ForeignKey, Date
+    create_engine, func, insert, inspect, select, text, update, Column, Integer, String, Float, DateTime, Text, JSON,
+    ForeignKey, Date, Index, LargeBinary
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
-from config import DATABASE_URL
+from sqlalchemy.orm import relationship, scoped_session, sessionmaker
+from config import (
+    DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_POOL_RECYCLE, DB_POOL_SIZE
+)
 
 Base = declarative_base()
 
@@ -43,6 +49,9 @@ class Material(Base):
 
 class HistoricalDemand(Base):
     __tablename__ = 'historical_demand'
+    __table_args__ = (
+        Index('ix_historical_demand_material_date', 'material_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     material_id = Column(Integer, ForeignKey('materials.id'), nullable=False)
@@ -77,13 +86,19 @@ class Optimization(Base):
     material = relationship("Material", back_populates="optimizations")
     optimal_policies = relationship("OptimalPolicy", back_populates="optimization")
     results = relationship("OptimizationResult", back_populates="optimization")
+    solution = relationship("OptimizationSolution", back_populates="optimization", uselist=False)
+    policy_summaries = relationship("PolicySummary", back_populates="optimization")
 
 class OptimalPolicy(Base):
     __tablename__ = 'optimal_policies'
+    __table_args__ = (
+        Index('ix_optimal_policies_opt_period_level', 'optimization_id', 'period', 'inventory_level'),
+    )
 
     id = Column(Integer, primary_key=True)
     optimization_id = Column(Integer, ForeignKey('optimizations.id'), nullable=False)
     period = Column(Integer, nullable=False)
+    inventory_level = Column(Integer)
     reorder_point = Column(Float, nullable=False)
     order_up_to_level = Column(Float, nullable=False)
     expected_cost = Column(Float, nullable=False)
@@ -93,6 +108,9 @@ class OptimalPolicy(Base):
 
 class OptimizationResult(Base):
     __tablename__ = 'optimization_results'
+    __table_args__ = (
+        Index('ix_optimization_results_opt_period_level', 'optimization_id', 'period', 'inventory_level'),
+    )
 
     id = Column(Integer, primary_key=True)
     optimization_id = Column(Integer, ForeignKey('optimizations.id'), nullable=False)
@@ -107,22 +125,235 @@ class OptimizationResult(Base):
 
     optimization = relationship("Optimization", back_populates="results")
 
+class OptimizationSolution(Base):
+    """
+    V y policy completos de una optimización como arreglos .npy comprimidos
+    (modo de almacenamiento 'blob', en lugar de una fila por estado).
+    """
+    __tablename__ = 'optimization_solutions'
 
-def init_db(db_url: str = None):
+    id = Column(Integer, primary_key=True)
+    optimization_id = Column(Integer, ForeignKey('optimizations.id'), nullable=False, unique=True)
+    value_function = Column(LargeBinary, nullable=False)
+    policy = Column(LargeBinary, nullable=False)
+    compression = Column(String(20), nullable=False, default='zlib')
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    optimization = relationship("Optimization", back_populates="solution")
+
+class PolicySummary(Base):
     """
-    Inicializa la conexión a la base de datos y crea las tablas.
+    Resumen (s_t, S_t) por periodo, calculado al resolver (helpers.policy_summary,
+    o el (s_t, S_t) del solver cuando hay costo fijo K).
+    """
+    __tablename__ = 'policy_summaries'
+    __table_args__ = (
+        Index('ix_policy_summaries_opt_period', 'optimization_id', 'period', unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    optimization_id = Column(Integer, ForeignKey('optimizations.id'), nullable=False)
+    period = Column(Integer, nullable=False)
+    reorder_point = Column(Float)
+    order_up_to_level = Column(Float)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    optimization = relationship("Optimization", back_populates="policy_summaries")
+
+
+def create_db_engine(db_url: str = None):
+    """
+    Crea un engine con el pool de conexiones configurado (DB_POOL_*).
+    SQLite usa su pool por defecto, sin tamaño ni desborde.
     """
     url = db_url or DATABASE_URL
-    engine = create_engine(url)
+    options = {'pool_pre_ping': DB_POOL_PRE_PING, 'pool_recycle': DB_POOL_RECYCLE}
+    if not url.startswith('sqlite'):
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    return create_engine(url, **options)
+
+
+def init_db(db_url: str = None):
+    """
+    Inicializa la conexión a la base de datos, crea las tablas y añade las
+    columnas e índices nuevos que create_all no agrega a tablas existentes.
+    """
+    engine = create_db_engine(db_url)
     Base.metadata.create_all(engine)
+    add_missing_columns(engine)
+    create_missing_indexes(engine)
     return engine
 
 
+def create_missing_indexes(engine) -> None:
+    """
+    Crea los índices de __table_args__ que falten: create_all omite las
+    tablas existentes y con ellas sus índices nuevos.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def add_missing_columns(engine) -> list:
+    """
+    ALTER TABLE para las columnas añadidas a tablas ya existentes en bases
+    creadas con versiones anteriores (optimal_policies.inventory_level).
+    Devuelve las columnas añadidas como 'tabla.columna'.
+    """
+    added = []
+    columns = {column['name'] for column in inspect(engine).get_columns(OptimalPolicy.__tablename__)}
+    if 'inventory_level' not in columns:
+        with engine.begin() as connection:
+            connection.execute(text(
+                f"ALTER TABLE {OptimalPolicy.__tablename__} ADD COLUMN inventory_level INTEGER"
+            ))
+        added.append(f"{OptimalPolicy.__tablename__}.inventory_level")
+    return added
+
+
+# Engine único por proceso y sesiones por hilo (una por petición en Flask)
+_engine = None
+db_session = scoped_session(sessionmaker())
+
+
+def get_engine():
+    """
+    Engine compartido del proceso, creado la primera vez que se usa.
+    No crea tablas: eso lo hace init_db.py.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_db_engine()
+        db_session.configure(bind=_engine)
+    return _engine
+
+
 def get_session(engine=None):
     """
-    Devuelve una sesión de SQLAlchemy ligada al engine.
+    Devuelve una sesión de SQLAlchemy.
+
+    Sin engine, la sesión del hilo actual ligada al engine compartido; se
+    cierra con remove_session (al final de cada petición en la app web).
+    Con engine, una sesión nueva que cierra quien la pide.
     """
     if engine is None:
-        engine = init_db()
-    Session = sessionmaker(bind=engine)
-    return Session()
+        get_engine()
+        return db_session()
+    return sessionmaker(bind=engine)()
+
+
+def remove_session(exception=None):
+    """
+    Cierra la sesión del hilo actual y devuelve su conexión al pool.
+    """
+    db_session.remove()
+
+
+def bulk_insert(session, model, columns: dict) -> int:
+    """
+    Inserta en bloque filas dadas por columnas (nombre -> arreglo/lista).
+
+    En PostgreSQL usa COPY FROM STDIN; en otros motores, un único INSERT
+    ejecutado con executemany. No hace commit: las filas quedan en la
+    transacción de la sesión. Devuelve el número de filas insertadas.
+    """
+    names = list(columns)
+    values = [c.tolist() if hasattr(c, 'tolist') else list(c) for c in columns.values()]
+    n_rows = len(values[0]) if values else 0
+    if n_rows == 0:
+        return 0
+
+    created_at = datetime.utcnow()
+    connection = session.connection()
+    if connection.dialect.name == 'postgresql':
+        buffer = io.StringIO()
+        stamp = created_at.isoformat()
+        for row in zip(*values):
+            buffer.write(','.join(map(str, row)))
+            buffer.write(f',{stamp}\n')
+        buffer.seek(0)
+        table = model.__table__.name
+        cursor = connection.connection.cursor()
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(names)}, created_at) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    else:
+        rows = [dict(zip(names, row), created_at=created_at) for row in zip(*values)]
+        session.execute(insert(model), rows)
+    return n_rows
+
+
+def backfill_inventory_levels(session) -> int:
+    """
+    Completa optimal_policies.inventory_level en filas guardadas antes de
+    existir la columna (NULL): las filas de cada periodo se insertaron en
+    orden I = 0..I_max, así que el nivel es su posición por id dentro de
+    (optimization_id, period). No hace commit. Devuelve las filas completadas.
+    """
+    ranked = (select(
+                  OptimalPolicy.id,
+                  (func.row_number().over(partition_by=(OptimalPolicy.optimization_id, OptimalPolicy.period),
+                                          order_by=OptimalPolicy.id) - 1).label('level'))
+              .where(OptimalPolicy.inventory_level.is_(None))
+              .subquery())
+    result = session.execute(
+        update(OptimalPolicy)
+        .where(OptimalPolicy.id == ranked.c.id)
+        .values(inventory_level=ranked.c.level)
+    )
+    return result.rowcount
+
+
+def encode_array(array) -> bytes:
+    """
+    Serializa un arreglo como .npy comprimido con zlib.
+    """
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(array), allow_pickle=False)
+    return zlib.compress(buffer.getvalue(), 6)
+
+
+def decode_array(blob: bytes) -> np.ndarray:
+    """
+    Inversa de encode_array.
+    """
+    return np.load(io.BytesIO(zlib.decompress(blob)), allow_pickle=False)
+
+
+def save_solution_blob(session, optimization_id: int, V, policy) -> None:
+    """
+    Guarda V y policy como blobs comprimidos. No hace commit.
+    """
+    session.add(OptimizationSolution(
+        optimization_id=optimization_id,
+        value_function=encode_array(V),
+        policy=encode_array(policy),
+        compression='zlib'
+    ))
+
+
+def save_policy_summary(session, optimization_id: int, summary) -> None:
+    """
+    Guarda el resumen [(s_t, S_t), ...] como filas PolicySummary. No hace commit.
+    """
+    for t, (s_t, S_t) in enumerate(summary):
+        session.add(PolicySummary(
+            optimization_id=optimization_id, period=t,
+            reorder_point=s_t, order_up_to_level=S_t
+        ))
+
+
+def load_solution_arrays(session, optimization_id: int, fields=('value_function', 'policy')):
+    """
+    Decodifica bajo demanda los arreglos guardados en modo 'blob'.
+    Solo lee de la base de datos las columnas pedidas.
+
+    Returns:
+        Dict campo -> np.ndarray, o None si la optimización no usa blobs.
+    """
+    columns = [getattr(OptimizationSolution, field) for field in fields]
+    row = session.query(*columns).filter(OptimizationSolution.optimization_id == optimization_id).first()
+    if row is None:
+        return None
+    return {field: decode_array(blob) for field, blob in zip(fields, row)}
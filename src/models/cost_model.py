@@ -1,10 +1,112 @@
+import numpy as np
+
+from src.utils.mathematical_utils import truncated_convolution
+
+
+def demand_pmf(demand_dist) -> np.ndarray:
+    """
+    Devuelve la función de masa de la demanda sobre la malla 0..d_max:
+    pmf[d] = P(D = d). Exige soporte entero y no negativo.
+    """
+    support = np.asarray(demand_dist.get_support(), dtype=float)
+    probs = np.asarray(demand_dist.get_probabilities(), dtype=float)
+    if np.any(support < 0) or not np.all(support == np.round(support)):
+        raise ValueError("El soporte de la demanda debe contener enteros no negativos.")
+
+    support = support.astype(int)
+    return np.bincount(support, weights=probs, minlength=support.max() + 1)
+
+
 class CostModel:
-    """Cálculo de costos inmediatos y esperados."""
-    def __init__(self, h, p):
-        pass
+    """
+    Cálculo de costos inmediatos y esperados.
+
+    Trabaja con el nivel de reposición y = I + x. Para cada distribución de
+    demanda precalcula (una sola vez) las tablas sobre y = 0..y_max:
+        A(y) = E[(y - D)+],  B(y) = E[(D - y)+],  L(y) = h·A(y) + p·B(y)
+    a partir de sumas acumuladas de la distribución.
+    """
+
+    def __init__(self, h, p, expectation: str = 'auto'):
+        """
+        Args:
+            h: Costo de almacenamiento por unidad
+            p: Costo de penalización por unidad faltante
+            expectation: Núcleo de E[V_{t+1}]: 'direct', 'fft' o 'auto'
+                (elige según |D| e I_max)
+        """
+        self.h = h
+        self.p = p
+        self.expectation = expectation
+        self._tables = {}
+
+    def immediate_cost(self, t, I, x, D, c_t, K: float = 0):
+        """
+        Costo del periodo t: K·[x>0] + c_t·x + h·(I+x-D)+ + p·(D-I-x)+.
+        """
+        I_next = I + x - D
+        return (K if x > 0 else 0) + c_t * x + self.h * max(I_next, 0) + self.p * max(-I_next, 0)
+
+    def expected_cost(self, t, I, x, demand_dist, c_t, K: float = 0):
+        """
+        Costo esperado del periodo t: K·[x>0] + c_t·x + L(I + x).
+        """
+        support = np.asarray(demand_dist.get_support())
+        probs = np.asarray(demand_dist.get_probabilities())
+        I_next = I + x - support
+        loss = self.h * np.maximum(I_next, 0) + self.p * np.maximum(-I_next, 0)
+        return (K if x > 0 else 0) + c_t * x + float(np.dot(probs, loss))
+
+    def demand_tables(self, demand_dist, y_max: int) -> dict:
+        """
+        Tablas precalculadas sobre y = 0..y_max para la distribución dada:
+            'pmf': P(D = d) en la malla 0..d_max
+            'tail': P(D > y)
+            'excess': A(y) = E[(y - D)+]
+            'shortfall': B(y) = E[(D - y)+]
+        """
+        key = (id(demand_dist), int(y_max))
+        cached = self._tables.get(key)
+        if cached is not None and cached[0] is demand_dist:
+            return cached[1]
+
+        pmf = demand_pmf(demand_dist)
+        d = np.arange(len(pmf))
+        y = np.arange(int(y_max) + 1)
+        idx = np.minimum(y, len(pmf) - 1)
+
+        cdf = np.cumsum(pmf)
+        partial_mean = np.cumsum(d * pmf)
+        F = cdf[idx]
+        M = partial_mean[idx]
+        mean = partial_mean[-1]
+
+        tables = {
+            'pmf': pmf,
+            'tail': np.maximum(1.0 - F, 0.0),
+            'excess': np.maximum(y * F - M, 0.0),
+            'shortfall': np.maximum((mean - M) - y * (1.0 - F), 0.0),
+        }
+        self._tables[key] = (demand_dist, tables)
+        return tables
+
+    def expected_loss(self, demand_dist, y_max: int) -> np.ndarray:
+        """
+        L(y) = E[h·(y - D)+ + p·(D - y)+] para y = 0..y_max.
+        """
+        tables = self.demand_tables(demand_dist, y_max)
+        return self.h * tables['excess'] + self.p * tables['shortfall']
 
-    def immediate_cost(self, t, I, x, D, c_t):
-        pass
+    def expected_future(self, V_next: np.ndarray, demand_dist) -> np.ndarray:
+        """
+        E[V_{t+1}(max(y - D, 0))] para y = 0..n-1 sobre el último eje de
+        V_next (admite un lote de filas de valor con forma (..., n)).
 
-    def expected_cost(self, t, I, x, demand_dist, c_t):
-        pass
+        La parte y - D ≥ 0 es una convolución de V_{t+1} con la pmf (directa
+        o por FFT) y el truncamiento por ventas perdidas se reduce al término
+        de cola P(D > y)·V_{t+1}(0).
+        """
+        n = V_next.shape[-1]
+        tables = self.demand_tables(demand_dist, n - 1)
+        convolved = truncated_convolution(V_next, tables['pmf'], self.expectation)
+        return convolved + tables['tail'] * V_next[..., :1]
@@ -25,3 +25,14 @@ class DemandModel:
 
     def get_probabilities(self):
         return self.probabilities
+
+
+def bucket_demand(demand_dist, step: int) -> DemandModel:
+    """
+    Distribución de demanda agregada en cubetas de tamaño step:
+    D_c = round(D / step), sumando las probabilidades de cada cubeta.
+    """
+    support = np.rint(np.asarray(demand_dist.get_support(), dtype=float) / step).astype(int)
+    probs = np.asarray(demand_dist.get_probabilities(), dtype=float)
+    buckets, inverse = np.unique(support, return_inverse=True)
+    return DemandModel(buckets, np.bincount(inverse, weights=probs))
@@ -1,4 +1,86 @@
+import numpy as np
+
+
 class PolicyModel:
-    """Representa la política (s_t, S_t) óptima."""
-    def __init__(self):
-        pass
+    """
+    Representa la política (s_t, S_t) óptima.
+
+    En el periodo t se ordena si I ≤ s_t, llevando el inventario hasta S_t
+    sin exceder x_max: x_t(I) = min(S_t - I, x_max) si I ≤ s_t, 0 si no.
+    Solo almacena dos enteros por periodo y se indexa como la política
+    tabular: policy[t, I], policy[t], np.asarray(policy).
+    """
+
+    def __init__(self, reorder_points, order_up_to_levels, x_max: int, I_max: int):
+        """
+        Args:
+            reorder_points: s_t por periodo (-1 si no se ordena nunca)
+            order_up_to_levels: S_t por periodo
+            x_max: Cantidad máxima de orden
+            I_max: Nivel máximo de inventario
+        """
+        self.reorder_points = np.asarray(reorder_points, dtype=np.int64)
+        self.order_up_to_levels = np.asarray(order_up_to_levels, dtype=np.int64)
+        self.x_max = int(x_max)
+        self.I_max = int(I_max)
+        self.dtype = np.min_scalar_type(self.x_max)
+
+    @classmethod
+    def base_stock(cls, order_up_to_levels, x_max: int, I_max: int) -> 'PolicyModel':
+        """
+        Política de nivel base: se ordena si I < S_t (s_t = S_t - 1).
+        """
+        levels = np.asarray(order_up_to_levels, dtype=np.int64)
+        return cls(levels - 1, levels, x_max, I_max)
+
+    @property
+    def T(self) -> int:
+        return len(self.order_up_to_levels)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.T, self.I_max + 1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.reorder_points.nbytes + self.order_up_to_levels.nbytes
+
+    def row(self, t: int) -> np.ndarray:
+        """
+        Cantidades a pedir x_t(I) para I = 0..I_max.
+        """
+        levels = np.arange(self.I_max + 1)
+        orders = np.minimum(self.order_up_to_levels[t] - levels, self.x_max)
+        orders = np.where(levels <= self.reorder_points[t], np.maximum(orders, 0), 0)
+        return orders.astype(self.dtype)
+
+    def summary(self) -> list:
+        """
+        Pares (s_t, S_t) por periodo; (None, None) en los periodos sin pedidos.
+        """
+        return [(int(s_t), int(S_t)) if s_t >= 0 else (None, None)
+                for s_t, S_t in zip(self.reorder_points, self.order_up_to_levels)]
+
+    def to_array(self, dtype=None) -> np.ndarray:
+        """
+        Materializa la política tabular T×(I_max+1).
+        """
+        table = np.empty(self.shape, dtype=dtype or self.dtype)
+        for t in range(self.T):
+            table[t] = self.row(t)
+        return table
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_array(dtype)
+
+    def __len__(self) -> int:
+        return self.T
+
+    def __iter__(self):
+        return (self.row(t) for t in range(self.T))
+
+    def __getitem__(self, key):
+        t, I = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(t, (int, np.integer)):
+            return self.row(int(t))[I]
+        return self.to_array()[t, I]
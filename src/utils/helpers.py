@@ -1,4 +1,5 @@
 import bisect
+import numpy as np
 
 def binary_search_threshold(value_function, t, I_max, c_t):
     """
@@ -12,3 +13,36 @@ def binary_search_threshold(value_function, t, I_max, c_t):
         else:
             low = mid + 1
     return low
+
+
+def binary_search_minimum(values, tol=0.0):
+    """
+    Búsqueda binaria del primer mínimo de una sucesión unimodal:
+    menor índice y con values[y+1] - values[y] ≥ -tol.
+    """
+    low, high = 0, len(values) - 1
+    while low < high:
+        mid = (low + high) // 2
+        if values[mid + 1] - values[mid] >= -tol:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def policy_summary(policy):
+    """
+    Resumen (s_t, S_t) por periodo de una política tabular x = policy[t, I]:
+    s_t es el mayor nivel de inventario con pedido (se ordena si I ≤ s_t)
+    y S_t = s_t + policy[t, s_t] el nivel de reposición correspondiente.
+    Devuelve (None, None) en los periodos sin pedidos.
+    """
+    policy = np.asarray(policy)
+    ordering = policy > 0
+    # Último índice con pedido en cada fila
+    last = policy.shape[1] - 1 - np.argmax(ordering[:, ::-1], axis=1)
+    orders = policy[np.arange(policy.shape[0]), last]
+    summary = []
+    for has_order, s_t, x in zip(ordering.any(axis=1).tolist(), last.tolist(), orders.tolist()):
+        summary.append((s_t, s_t + int(x)) if has_order else (None, None))
+    return summary
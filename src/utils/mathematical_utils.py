@@ -1,3 +1,121 @@
+import numpy as np
+from scipy.signal import fftconvolve
+
+# La convolución por FFT compensa cuando |D| supera ~FFT_CROSSOVER·log2(n)
+FFT_CROSSOVER = 32
+CONVOLUTION_METHODS = ('auto', 'direct', 'fft')
+
+
 def compute_bounds(params):
     """Funciones matemáticas auxiliares (e.g., convexidad, cotas)."""
     pass
+
+
+def window_argmin(values: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mínimo sobre ventanas deslizantes [i, i + width) del último eje.
+
+    Las posiciones fuera del arreglo cuentan como +inf. En caso de empate
+    se devuelve el menor desplazamiento, igual que una enumeración con '<'.
+
+    Returns:
+        (offset, minimum): desplazamiento k del mínimo dentro de cada ventana
+        y su valor values[..., i + k].
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    best = values.copy()
+    offset = np.zeros(values.shape, dtype=int)
+
+    for k in range(1, min(width, n)):
+        candidate = values[..., k:]
+        better = candidate < best[..., :n - k]
+        best[..., :n - k][better] = candidate[better]
+        offset[..., :n - k][better] = k
+    return offset, best
+
+
+def sparse_window_argmin(values: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Igual que window_argmin para un arreglo 1-D, en O(n·log(width)) con una
+    tabla dispersa: mínimos de bloques de tamaño 2^j y, para cada ventana,
+    los dos bloques (solapados) que la cubren. En empates gana el bloque
+    izquierdo, que conserva el menor desplazamiento.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    index = np.arange(n)
+
+    def shifted(best, best_index, shift):
+        right = np.full(n, np.inf)
+        right_index = np.zeros(n, dtype=int)
+        right[:max(n - shift, 0)] = best[shift:]
+        right_index[:max(n - shift, 0)] = best_index[shift:]
+        better = right < best
+        return np.where(better, right, best), np.where(better, right_index, best_index)
+
+    best, best_index = values.copy(), index.copy()
+    span = 1
+    while 2 * span <= width:
+        best, best_index = shifted(best, best_index, span)
+        span *= 2
+    if width > span:
+        best, best_index = shifted(best, best_index, width - span)
+    return best_index - index, best
+
+
+def is_unimodal(values: np.ndarray, tol: float = 1e-9) -> bool:
+    """
+    Verifica que la sucesión sea unimodal (cuasi-convexa discreta):
+    estrictamente decreciente hasta su primer mínimo y no decreciente después.
+    La tolerancia es relativa a la escala de los valores.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 3:
+        return True
+    diffs = np.diff(values)
+    slack = tol * max(1.0, float(np.max(np.abs(values))))
+    rising = np.flatnonzero(diffs >= -slack)
+    return len(rising) == 0 or bool(np.all(diffs[rising[0]:] >= -slack))
+
+
+def choose_convolution_method(n: int, m: int) -> str:
+    """
+    Elige entre convolución directa O(n·m) y FFT O((n+m)·log(n+m)) para
+    una señal de longitud n y un núcleo de longitud m.
+    """
+    if m <= 1:
+        return 'direct'
+    return 'fft' if n * m > FFT_CROSSOVER * (n + m) * np.log2(n + m) else 'direct'
+
+
+def truncated_convolution(values: np.ndarray, kernel: np.ndarray, method: str = 'auto') -> np.ndarray:
+    """
+    Convolución causal truncada sobre el último eje:
+        out[..., y] = sum_{d=0}^{y} kernel[d] · values[..., y - d],  y = 0..n-1
+
+    Args:
+        values: Arreglo (..., n), p.ej. V_{t+1} o un lote de filas de valor
+        kernel: Núcleo 1-D, p.ej. la pmf de la demanda en la malla 0..d_max
+        method: 'direct', 'fft' o 'auto' (según n y el tamaño del núcleo)
+    """
+    if method not in CONVOLUTION_METHODS:
+        raise ValueError(f"Método de convolución desconocido: {method!r} (opciones: {CONVOLUTION_METHODS}).")
+
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    kernel = np.asarray(kernel, dtype=float)[:n]
+    if method == 'auto':
+        method = choose_convolution_method(n, len(kernel))
+    if method == 'fft' and not np.all(np.isfinite(values)):
+        method = 'direct'
+
+    if method == 'fft':
+        return fftconvolve(values, kernel.reshape((1,) * (values.ndim - 1) + (-1,)), axes=-1)[..., :n]
+    if values.ndim == 1:
+        return np.convolve(values, kernel)[:n]
+
+    out = np.zeros(values.shape)
+    for d in np.flatnonzero(kernel):
+        out[..., d:] += kernel[d] * values[..., :n - d]
+    return out
@@ -1,12 +1,23 @@
-from flask import Blueprint, request, jsonify, abort
+import json
+import threading
+from collections import OrderedDict
+from flask import Blueprint, Response, request, jsonify, abort, stream_with_context, url_for
 from datetime import datetime
 import numpy as np
+from sqlalchemy import and_, case, func, or_
 
-from src.core.optimization_engine import OptimizationEngine
+from config import BLOB_COLUMNS_CACHE_SIZE, SOLUTION_STORAGE
+from src.core.solution_cache import get_default_cache
 from src.data.database_manager import (
-    get_session, User, Material,
-    Optimization, OptimalPolicy, OptimizationResult
+    get_session, load_solution_arrays, User, Material,
+    Optimization, OptimalPolicy, OptimizationResult, PolicySummary
 )
+from src.models.demand_model import DemandModel
+from src.web.optimization_jobs import (
+    check_storage_mode, execute_optimization, get_job_queue,
+    policy_row_arrays, result_row_arrays
+)
+from src.web.serialization import response_format, solution_response
 
 optimization_bp = Blueprint('optimization', __name__)
 
@@ -15,8 +26,22 @@ def run_optimization():
     """
     Ejecuta la optimización, persiste los resultados
     en la base de datos y devuelve JSON con optimization_id, value_function y policy.
+
+    Con "async": true (o ?async=1) la optimización queda 'pending', se encola
+    para los procesos worker y se responde 202 con su optimization_id.
+
+    "storage" elige cómo se guarda la solución: 'rows' (una fila por estado)
+    o 'blob' (V y policy comprimidos); por defecto SOLUTION_STORAGE.
+
+    La respuesta síncrona admite ?format=json|npy|npz|summary o la cabecera
+    Accept (ver src.web.serialization).
     """
     data = request.get_json()
+    try:
+        storage = check_storage_mode(data.get('storage', SOLUTION_STORAGE))
+        fmt = response_format(request)
+    except ValueError as e:
+        abort(400, description=str(e))
     session = get_session()
 
     # Asegurar existencia de usuario
@@ -49,6 +74,9 @@ def run_optimization():
         session.add(material)
         session.commit()
 
+    # Ejecución asíncrona: se encola y se consulta con GET /optimization/<id>
+    run_async = bool(data.get('async', False)) or request.args.get('async') in ('1', 'true')
+
     # Persistir registro de optimización
     opt = Optimization(
         user_id=user.id,
@@ -60,79 +88,42 @@ def run_optimization():
         max_order=data['max_order'],
         costs=data['costs'],
         demand_params=data['demand_params'],
-        status='running',
+        status='pending' if run_async else 'running',
         created_at=datetime.utcnow()
     )
     session.add(opt)
     session.commit()
 
-    # Ejecutar motor de optimización
-    engine = OptimizationEngine(
-        I_init=opt.initial_inventory,
-        I_max=int(opt.max_inventory),
-        x_max=int(opt.max_order),
-        horizon=int(opt.horizon),
-        c_ts=opt.costs['c'],
-        h=opt.costs['h'],
-        p=opt.costs['p'],
-        demand_support=opt.demand_params['support'],
-        demand_prob=opt.demand_params['probabilities']
-    )
-    V, policy = engine.run()
-
-    # Persistir política óptima
-    for t in range(policy.shape[0]):
-        for I, x in enumerate(policy[t]):
-            session.add(OptimalPolicy(
-                optimization_id=opt.id,
-                period=t,
-                reorder_point=I if x > 0 else 0,
-                order_up_to_level=I + int(x),
-                expected_cost=float(V[t, I]),
-                created_at=datetime.utcnow()
-            ))
-    session.commit()
+    if run_async:
+        get_job_queue().submit(opt.id, storage)
+        response = jsonify({'optimization_id': opt.id, 'status': opt.status})
+        response.status_code = 202
+        response.headers['Location'] = url_for('optimization.get_optimization', optimization_id=opt.id)
+        return response
 
-    # Persistir resultados detallados
-    demand_dist = engine.solver.demand_dist
-    support = demand_dist.get_support()
-    probs = demand_dist.get_probabilities()
-    c_vec = np.array(opt.costs['c'])
-    h = opt.costs['h']
-    p_cost = opt.costs['p']
-
-    for t in range(policy.shape[0]):
-        for I in range(int(opt.max_inventory) + 1):
-            x = int(policy[t, I])
-            exp_demand = float(np.dot(support, probs))
-            exp_holding = float(np.sum(probs * np.maximum(I + x - support, 0) * h))
-            exp_shortage = float(np.sum(probs * np.maximum(support - (I + x), 0) * p_cost))
-            purchase = float(c_vec[t] * x)
-            total_period_cost = purchase + exp_holding + exp_shortage
-
-            session.add(OptimizationResult(
-                optimization_id=opt.id,
-                period=t,
-                inventory_level=float(I),
-                optimal_order=float(x),
-                expected_demand=exp_demand,
-                expected_holding_cost=exp_holding,
-                expected_shortage_cost=exp_shortage,
-                total_period_cost=total_period_cost,
-                created_at=datetime.utcnow()
-            ))
-    session.commit()
+    # Ejecutar motor de optimización y persistir resultados
+    V, policy, evaluation = execute_optimization(session, opt, storage)
 
-    # Marcar completada
-    opt.status = 'completed'
-    opt.solution_time = engine.solver.solution_time
-    session.commit()
+    return solution_response(
+        fmt, V, policy, I_init=int(opt.initial_inventory),
+        summary=evaluation['policy_summary'],
+        optimization_id=opt.id,
+        total_cost=evaluation['total_cost'],
+        expected_costs={
+            'purchase': evaluation['purchase_cost'].tolist(),
+            'holding': evaluation['holding_cost'].tolist(),
+            'shortage': evaluation['shortage_cost'].tolist(),
+            'total': evaluation['total_cost']
+        }
+    )
 
-    return jsonify({
-        'optimization_id': opt.id,
-        'value_function': V.tolist(),
-        'policy': policy.tolist()
-    })
+
+@optimization_bp.route('/cache', methods=['GET'])
+def get_cache_stats():
+    """
+    Contadores de aciertos/fallos de la caché de soluciones.
+    """
+    return jsonify(get_default_cache().stats())
 
 
 @optimization_bp.route('/<int:optimization_id>', methods=['GET'])
@@ -156,61 +147,266 @@ def get_optimization(optimization_id):
     })
 
 
+POLICY_FIELDS = ('period', 'inventory_level', 'reorder_point', 'order_up_to_level', 'expected_cost')
+RESULT_FIELDS = ('period', 'inventory_level', 'optimal_order', 'expected_demand',
+                 'expected_holding_cost', 'expected_shortage_cost', 'total_period_cost')
+# Filas por lote al leer del cursor del servidor en modo streaming
+STREAM_BATCH_SIZE = 1000
+
+# Columnas decodificadas de soluciones 'blob': (url de la base, id, 'policy'|'results') -> columnas
+_blob_columns = OrderedDict()
+_blob_columns_lock = threading.Lock()
+
+
+def _row_query() -> dict:
+    """
+    Parámetros de /policy y /results:
+    period_from, period_to, inventory_from, inventory_to (rangos inclusivos),
+    limit (tamaño de página), after (cursor "period:inventory_level" de la
+    última fila recibida) y format=ndjson (o Accept: application/x-ndjson).
+    """
+    args = request.args
+    query = {}
+    for name in ('period_from', 'period_to', 'inventory_from', 'inventory_to', 'limit'):
+        value = args.get(name)
+        query[name] = None if value is None else int(value)
+    if query['limit'] is not None and query['limit'] <= 0:
+        raise ValueError("limit debe ser positivo")
+    after = args.get('after')
+    query['after'] = None
+    if after:
+        period, level = after.split(':')
+        query['after'] = (int(period), int(level))
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    query['stream'] = args.get('format') == 'ndjson' or best == 'application/x-ndjson'
+    return query
+
+
+def _uses_inventory_level(query) -> bool:
+    return any(query[name] is not None for name in ('inventory_from', 'inventory_to', 'after', 'limit'))
+
+
+def _check_inventory_levels(session, optimization_id):
+    """
+    Filas OptimalPolicy anteriores a la columna inventory_level (NULL) no
+    admiten filtros por inventario, paginación por clave ni el resumen
+    agregado en SQL: 409 hasta completarlas con init_db.py en lugar de
+    omitirlas o fallar.
+    """
+    missing = (session.query(OptimalPolicy.id)
+               .filter(OptimalPolicy.optimization_id == optimization_id,
+                       OptimalPolicy.inventory_level.is_(None))
+               .first())
+    if missing is not None:
+        abort(409, description='inventory_level vacío en optimal_policies: ejecute python init_db.py '
+                               'para completarlo')
+
+
+def _cursor(row: dict) -> str:
+    return f"{int(row['period'])}:{int(row['inventory_level'])}"
+
+
+def _select_rows(session, model, fields, optimization_id, query):
+    """
+    Consulta por columnas con filtros y paginación por clave (keyset) sobre
+    (period, inventory_level), sin materializar objetos ORM.
+    """
+    rows = session.query(*[getattr(model, f) for f in fields]).filter(model.optimization_id == optimization_id)
+    if query['period_from'] is not None:
+        rows = rows.filter(model.period >= query['period_from'])
+    if query['period_to'] is not None:
+        rows = rows.filter(model.period <= query['period_to'])
+    if query['inventory_from'] is not None:
+        rows = rows.filter(model.inventory_level >= query['inventory_from'])
+    if query['inventory_to'] is not None:
+        rows = rows.filter(model.inventory_level <= query['inventory_to'])
+    if query['after'] is not None:
+        period, level = query['after']
+        rows = rows.filter(or_(model.period > period,
+                               and_(model.period == period, model.inventory_level > level)))
+    rows = rows.order_by(model.period, model.inventory_level)
+    if query['limit'] is not None:
+        # Una fila extra indica si hay página siguiente
+        rows = rows.limit(query['limit'] + (0 if query['stream'] else 1))
+    return rows
+
+
+def _blob_row_columns(session, optimization_id, kind: str):
+    """
+    Columnas de /policy (kind='policy') o /results (kind='results') de una
+    solución guardada en modo 'blob', o None si no la hay. Una solución no
+    cambia tras guardarse, así que se descomprime una sola vez y las páginas
+    siguientes salen de un LRU de BLOB_COLUMNS_CACHE_SIZE optimizaciones.
+    """
+    key = (str(session.get_bind().url), optimization_id, kind)
+    with _blob_columns_lock:
+        columns = _blob_columns.get(key)
+        if columns is not None:
+            _blob_columns.move_to_end(key)
+            return columns
+
+    if kind == 'policy':
+        arrays = load_solution_arrays(session, optimization_id)
+        if arrays is None:
+            return None
+        columns = policy_row_arrays(arrays['value_function'], arrays['policy'])
+    else:
+        arrays = load_solution_arrays(session, optimization_id, fields=('policy',))
+        if arrays is None:
+            return None
+        opt = session.get(Optimization, optimization_id)
+        demand_dist = DemandModel(opt.demand_params['support'], opt.demand_params['probabilities'])
+        columns = result_row_arrays(arrays['policy'], opt.costs, demand_dist)
+
+    with _blob_columns_lock:
+        _blob_columns[key] = columns
+        while len(_blob_columns) > BLOB_COLUMNS_CACHE_SIZE:
+            _blob_columns.popitem(last=False)
+    return columns
+
+
+def _select_columns(columns: dict, query) -> dict:
+    """
+    Mismos filtros y paginación que _select_rows sobre columnas de arreglos
+    (soluciones guardadas en modo 'blob'). Las columnas cubren la malla
+    completa en orden (period, inventory_level), así que period_* y after
+    acotan un tramo contiguo por aritmética; solo inventory_* recorre el
+    tramo con una máscara.
+    """
+    period, level = columns['period'], columns['inventory_level']
+    n_states = int(level[-1]) + 1 if len(level) else 1
+    start, stop = 0, len(period)
+    if query['period_from'] is not None:
+        start = max(start, query['period_from'] * n_states)
+    if query['period_to'] is not None:
+        stop = min(stop, (query['period_to'] + 1) * n_states)
+    if query['after'] is not None:
+        t, I = query['after']
+        start = max(start, t * n_states + min(I, n_states - 1) + 1)
+    start = min(max(start, 0), max(stop, 0))
+    stop = max(stop, start)
+
+    n_rows = None if query['limit'] is None else query['limit'] + (0 if query['stream'] else 1)
+    if query['inventory_from'] is None and query['inventory_to'] is None:
+        index = slice(start, stop if n_rows is None else min(stop, start + n_rows))
+    else:
+        mask = np.ones(stop - start, dtype=bool)
+        if query['inventory_from'] is not None:
+            mask &= level[start:stop] >= query['inventory_from']
+        if query['inventory_to'] is not None:
+            mask &= level[start:stop] <= query['inventory_to']
+        index = start + np.flatnonzero(mask)[:n_rows]
+    return {name: np.asarray(values)[index] for name, values in columns.items()}
+
+
+def _records(rows, fields):
+    for row in rows:
+        yield dict(zip(fields, row))
+
+
+def _column_records(columns: dict, fields):
+    """
+    Recorre columnas de arreglos como dicts, convirtiendo por lotes.
+    """
+    n_rows = len(columns[fields[0]])
+    for start in range(0, n_rows, STREAM_BATCH_SIZE):
+        batch = [np.asarray(columns[name][start:start + STREAM_BATCH_SIZE]).tolist() for name in fields]
+        yield from _records(zip(*batch), fields)
+
+
+def _rows_response(records, query, not_found: str):
+    """
+    NDJSON en streaming o lista JSON; con limit, la cabecera X-Next-Cursor
+    lleva el cursor de la página siguiente (solo en la respuesta JSON).
+    """
+    if query['stream']:
+        lines = (json.dumps(record) + '\n' for record in records)
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+    records = list(records)
+    if len(records) == 0 and query['after'] is None:
+        abort(404, description=not_found)
+    next_cursor = None
+    if query['limit'] is not None and len(records) > query['limit']:
+        records = records[:query['limit']]
+        next_cursor = _cursor(records[-1])
+    response = jsonify(records)
+    if next_cursor is not None:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+
 @optimization_bp.route('/<int:optimization_id>/policy', methods=['GET'])
 def get_policy(optimization_id):
+    try:
+        query = _row_query()
+    except ValueError as e:
+        abort(400, description=str(e))
     session = get_session()
-    policies: list[OptimalPolicy] = session.query(OptimalPolicy).filter_by(optimization_id=optimization_id).all()
-    if len(policies) == 0:
-        abort(404, description='Policy not found')
-    return jsonify([
-        {
-            'period': p.period,
-            'reorder_point': p.reorder_point,
-            'order_up_to_level': p.order_up_to_level,
-            'expected_cost': p.expected_cost
-        }
-        for p in policies
-    ])
+    columns = _blob_row_columns(session, optimization_id, 'policy')
+    if columns is not None:
+        columns = _select_columns(columns, query)
+        return _rows_response(_column_records(columns, POLICY_FIELDS), query, 'Policy not found')
+
+    if _uses_inventory_level(query):
+        _check_inventory_levels(session, optimization_id)
+    rows = _select_rows(session, OptimalPolicy, POLICY_FIELDS, optimization_id, query)
+    if query['stream']:
+        rows = rows.yield_per(STREAM_BATCH_SIZE)
+    return _rows_response(_records(rows, POLICY_FIELDS), query, 'Policy not found')
 
 
 @optimization_bp.route('/<int:optimization_id>/results', methods=['GET'])
 def get_results(optimization_id):
+    try:
+        query = _row_query()
+    except ValueError as e:
+        abort(400, description=str(e))
     session = get_session()
-    results: list[OptimizationResult] = session.query(OptimizationResult).filter_by(optimization_id=optimization_id).all()
-    if len(results) == 0:
-        abort(404, description='Results not found')
-    return jsonify([
-        {
-            'period': r.period,
-            'inventory_level': r.inventory_level,
-            'optimal_order': r.optimal_order,
-            'expected_demand': r.expected_demand,
-            'expected_holding_cost': r.expected_holding_cost,
-            'expected_shortage_cost': r.expected_shortage_cost,
-            'total_period_cost': r.total_period_cost
-        }
-        for r in results
-    ])
+    columns = _blob_row_columns(session, optimization_id, 'results')
+    if columns is not None:
+        columns = _select_columns(columns, query)
+        return _rows_response(_column_records(columns, RESULT_FIELDS), query, 'Results not found')
+
+    rows = _select_rows(session, OptimizationResult, RESULT_FIELDS, optimization_id, query)
+    if query['stream']:
+        rows = rows.yield_per(STREAM_BATCH_SIZE)
+    return _rows_response(_records(rows, RESULT_FIELDS), query, 'Results not found')
 
 
 @optimization_bp.route('/<int:optimization_id>/policy-summary', methods=['GET'])
 def get_policy_summary(optimization_id):
     session = get_session()
-    policies: list[OptimalPolicy] = session.query(OptimalPolicy).filter_by(optimization_id=optimization_id).all()
-    if len(policies) == 0:
+    # Resumen precalculado al resolver
+    summaries = (session.query(PolicySummary.period, PolicySummary.reorder_point, PolicySummary.order_up_to_level)
+                 .filter(PolicySummary.optimization_id == optimization_id)
+                 .order_by(PolicySummary.period)
+                 .all())
+    if not summaries:
+        _check_inventory_levels(session, optimization_id)
+        summaries = _legacy_policy_summary(session, optimization_id)
+    if not summaries:
         abort(404, description='Policy not found')
+    return jsonify([{'period': t, 's_t': s_t, 'S_t': S_t} for t, s_t, S_t in summaries])
+
 
-    summary = []
-    periods = sorted({p.period for p in policies})
-    for t in periods:
-        period_policies = [p for p in policies if p.period == t]
-        # Solo consideramos los niveles de inventario con pedido > 0
-        reorder_events = [p for p in period_policies if p.reorder_point > 0]  # type: ignore[reportGeneralTypeIssues]
-        if len(reorder_events) == 0:
-            s_t, S_t = None, None
-        else:
-            ev = min(reorder_events, key=lambda p: p.reorder_point)
-            s_t, S_t = ev.reorder_point, ev.order_up_to_level
-        summary.append({'period': t, 's_t': s_t, 'S_t': S_t})
-
-    return jsonify(summary)
+def _legacy_policy_summary(session, optimization_id):
+    """
+    Resumen de optimizaciones guardadas antes de PolicySummary, con una sola
+    consulta agrupada y la misma definición que helpers.policy_summary: por
+    periodo, s_t es el mayor inventory_level con pedido y S_t su
+    order_up_to_level (None si el periodo no tiene pedidos).
+    """
+    ordering = OptimalPolicy.order_up_to_level > OptimalPolicy.inventory_level
+    last_order = (session.query(
+                      OptimalPolicy.period.label('period'),
+                      func.max(case((ordering, OptimalPolicy.inventory_level))).label('s_t'))
+                  .filter(OptimalPolicy.optimization_id == optimization_id)
+                  .group_by(OptimalPolicy.period)
+                  .subquery())
+    return (session.query(last_order.c.period, last_order.c.s_t, OptimalPolicy.order_up_to_level)
+            .outerjoin(OptimalPolicy, and_(OptimalPolicy.optimization_id == optimization_id,
+                                           OptimalPolicy.period == last_order.c.period,
+                                           OptimalPolicy.inventory_level == last_order.c.s_t))
+            .order_by(last_order.c.period)
+            .all())
@@ -1,8 +1,10 @@
 from flask import Flask
+from src.data.database_manager import remove_session
 from src.web.api.optimization_routes import optimization_bp
 from src.web.api.data_routes import data_bp
 
 app = Flask(__name__)
+app.teardown_appcontext(remove_session)
 app.register_blueprint(optimization_bp, url_prefix='/optimization')
 app.register_blueprint(data_bp, url_prefix='/data')
 
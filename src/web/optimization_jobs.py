@@ -0,0 +1,284 @@
+import logging
+import multiprocessing
+import queue
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import update
+
+from config import DATABASE_URL, OPTIMIZATION_WORKERS, SOLUTION_STORAGE
+from src.core.optimization_engine import OptimizationEngine
+from src.core.policy_evaluator import PolicyEvaluator
+from src.core.solution_cache import get_default_cache
+from src.data.database_manager import (
+    bulk_insert, create_db_engine, get_session, save_policy_summary, save_solution_blob,
+    Optimization, OptimalPolicy, OptimizationResult
+)
+from src.models.cost_model import CostModel
+
+logger = logging.getLogger(__name__)
+
+STORAGE_MODES = ('rows', 'blob')
+
+
+def check_storage_mode(storage: str) -> str:
+    if storage not in STORAGE_MODES:
+        raise ValueError(f"storage debe ser uno de {STORAGE_MODES}, no {storage!r}")
+    return storage
+
+
+def execute_optimization(session, opt: Optimization, storage: str = None):
+    """
+    Resuelve una optimización registrada, persiste la solución y la marca
+    como completada, todo en una sola transacción.
+
+    Con storage='rows' se insertan en bloque las filas OptimalPolicy y
+    OptimizationResult; con storage='blob' se guardan V y policy comprimidos
+    y las filas se reconstruyen al leer. En ambos modos se guarda el resumen
+    (s_t, S_t) por periodo que sirve /policy-summary.
+
+    Returns:
+        (V, policy, evaluation) con evaluation de PolicyEvaluator.evaluate()
+        más 'policy_summary', el resumen (s_t, S_t) guardado
+    """
+    engine = OptimizationEngine(
+        I_init=opt.initial_inventory,
+        I_max=int(opt.max_inventory),
+        x_max=int(opt.max_order),
+        horizon=int(opt.horizon),
+        c_ts=opt.costs['c'],
+        h=opt.costs['h'],
+        p=opt.costs['p'],
+        demand_support=opt.demand_params['support'],
+        demand_prob=opt.demand_params['probabilities'],
+        K=opt.costs.get('K', 0),
+        method='sS' if opt.costs.get('K', 0) else 'vectorized',
+        # x_max puede romper la K-convexidad: la API devuelve siempre el óptimo exacto
+        verify_sS=True,
+        cache=get_default_cache()
+    )
+    storage = check_storage_mode(storage or SOLUTION_STORAGE)
+    V, policy = engine.run()
+    demand_dist = engine.solver.demand_dist
+
+    # Persistir política óptima y resultados detallados
+    if storage == 'blob':
+        save_solution_blob(session, opt.id, V, policy)
+    else:
+        save_solution_rows(session, opt, V, policy, demand_dist)
+    summary = engine.solver.summary()
+    save_policy_summary(session, opt.id, summary)
+
+    # Costos esperados a lo largo de la trayectoria desde el inventario inicial
+    evaluation = PolicyEvaluator(
+        policy, opt.costs, demand_dist, I_init=int(opt.initial_inventory)
+    ).evaluate()
+    evaluation['policy_summary'] = summary
+
+    # Marcar completada (misma transacción que las filas insertadas)
+    opt.status = 'completed'
+    opt.total_cost = evaluation['total_cost']
+    opt.solution_time = engine.solver.solution_time
+    opt.completed_at = datetime.utcnow()
+    session.commit()
+
+    return V, policy, evaluation
+
+
+def _state_grid(policy):
+    policy = np.asarray(policy)
+    T, n_states = policy.shape
+    periods = np.repeat(np.arange(T), n_states)
+    levels = np.tile(np.arange(n_states), T)
+    orders = policy.reshape(-1).astype(np.int64)
+    return periods, levels, orders
+
+
+def policy_row_arrays(V, policy) -> dict:
+    """
+    Columnas de OptimalPolicy como arreglos T·(I_max+1), en orden
+    (period, inventory_level).
+    """
+    periods, levels, orders = _state_grid(policy)
+    T = np.asarray(policy).shape[0]
+    return {
+        'period': periods,
+        'inventory_level': levels,
+        'reorder_point': np.where(orders > 0, levels, 0).astype(float),
+        'order_up_to_level': (levels + orders).astype(float),
+        'expected_cost': np.asarray(V[:T], dtype=float).reshape(-1),
+    }
+
+
+def result_row_arrays(policy, costs: dict, demand_dist) -> dict:
+    """
+    Columnas de OptimizationResult como arreglos T·(I_max+1), en orden
+    (period, inventory_level).
+
+    Los costos esperados de cada fila son condicionales al estado (t, I):
+    E[h·(I+x-D)+] y E[p·(D-I-x)+] salen de las tablas de CostModel.
+    """
+    periods, levels, orders = _state_grid(policy)
+    T, n_states = np.asarray(policy).shape
+    I_max = n_states - 1
+    y = np.minimum(levels + orders, I_max)
+
+    cost_model = CostModel(costs['h'], costs['p'])
+    tables = cost_model.demand_tables(demand_dist, I_max)
+    c_vec = np.broadcast_to(np.asarray(costs['c'], dtype=float), (T,))
+    expected_holding = costs['h'] * tables['excess'][y]
+    expected_shortage = costs['p'] * tables['shortfall'][y]
+    purchase = c_vec[periods] * orders + costs.get('K', 0) * (orders > 0)
+    expected_demand = float(np.dot(demand_dist.get_support(), demand_dist.get_probabilities()))
+
+    return {
+        'period': periods,
+        'inventory_level': levels.astype(float),
+        'optimal_order': orders.astype(float),
+        'expected_demand': np.full(len(periods), expected_demand),
+        'expected_holding_cost': expected_holding,
+        'expected_shortage_cost': expected_shortage,
+        'total_period_cost': purchase + expected_holding + expected_shortage,
+    }
+
+
+def save_solution_rows(session, opt: Optimization, V, policy, demand_dist) -> int:
+    """
+    Inserta en bloque las filas OptimalPolicy y OptimizationResult de una
+    solución, sin hacer commit. Devuelve el número de filas insertadas.
+    """
+    policy_columns = policy_row_arrays(V, policy)
+    result_columns = result_row_arrays(policy, opt.costs, demand_dist)
+    n_rows = len(policy_columns['period'])
+    policy_columns['optimization_id'] = np.full(n_rows, opt.id)
+    result_columns['optimization_id'] = np.full(n_rows, opt.id)
+    return (bulk_insert(session, OptimalPolicy, policy_columns)
+            + bulk_insert(session, OptimizationResult, result_columns))
+
+
+def claim_optimization(session, optimization_id: int) -> bool:
+    """
+    Pasa una optimización de 'pending' a 'running' de forma atómica.
+    Devuelve False si otro worker ya la tomó.
+    """
+    result = session.execute(
+        update(Optimization)
+        .where(Optimization.id == optimization_id, Optimization.status == 'pending')
+        .values(status='running')
+    )
+    session.commit()
+    return result.rowcount == 1
+
+
+def next_pending_optimization(session):
+    """
+    Id de la optimización pendiente más antigua (o None).
+    """
+    row = (session.query(Optimization.id)
+           .filter(Optimization.status == 'pending')
+           .order_by(Optimization.id)
+           .first())
+    return row[0] if row else None
+
+
+def process_optimization(session, optimization_id: int, storage: str = None) -> bool:
+    """
+    Reclama y ejecuta una optimización pendiente. Si falla, queda 'failed'
+    y el error se registra con su traza en el logger del módulo.
+    """
+    if not claim_optimization(session, optimization_id):
+        return False
+    opt = session.get(Optimization, optimization_id)
+    try:
+        execute_optimization(session, opt, storage)
+    except Exception:
+        logger.exception("La optimización %s falló", optimization_id)
+        session.rollback()
+        opt.status = 'failed'
+        opt.completed_at = datetime.utcnow()
+        session.commit()
+    return True
+
+
+def _worker_loop(jobs, stop, db_url, poll_interval):
+    """
+    Bucle de un proceso worker: atiende ids de la cola local y, cuando está
+    vacía, toma pendientes directamente de la base de datos (lo que recupera
+    los trabajos enviados antes de un reinicio, con el almacenamiento por
+    defecto SOLUTION_STORAGE).
+    """
+    session = get_session(create_db_engine(db_url))
+    while not stop.is_set():
+        try:
+            optimization_id, storage = jobs.get(timeout=poll_interval)
+        except queue.Empty:
+            optimization_id, storage = next_pending_optimization(session), None
+            if optimization_id is None:
+                continue
+        process_optimization(session, optimization_id, storage)
+        session.expire_all()
+    session.close()
+
+
+class OptimizationJobQueue:
+    """
+    Cola local de optimizaciones asíncronas atendida por procesos worker.
+
+    La tabla optimizations es la fuente de verdad: un trabajo es una fila con
+    status 'pending' y los workers la reclaman con un UPDATE condicional, por
+    lo que la cola en memoria solo acelera el despacho.
+    """
+
+    def __init__(self, n_workers: int = OPTIMIZATION_WORKERS, db_url: str = None,
+                 poll_interval: float = 1.0):
+        """
+        Args:
+            n_workers: Número de procesos worker
+            db_url: URL de la base de datos (por defecto DATABASE_URL)
+            poll_interval: Segundos de espera antes de consultar la base de datos
+        """
+        self.n_workers = max(int(n_workers or multiprocessing.cpu_count()), 1)
+        self.db_url = db_url or DATABASE_URL
+        self.poll_interval = poll_interval
+        self._jobs = multiprocessing.Queue()
+        self._stop = multiprocessing.Event()
+        self._workers = []
+
+    def start(self):
+        if self._workers:
+            return
+        self._stop.clear()
+        for _ in range(self.n_workers):
+            worker = multiprocessing.Process(
+                target=_worker_loop,
+                args=(self._jobs, self._stop, self.db_url, self.poll_interval),
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, optimization_id: int, storage: str = None):
+        """
+        Encola una optimización ya persistida con status 'pending'.
+        """
+        self.start()
+        self._jobs.put((int(optimization_id), storage))
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+
+_job_queue = None
+
+
+def get_job_queue() -> OptimizationJobQueue:
+    """
+    Cola de trabajos compartida por el proceso de la API.
+    """
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = OptimizationJobQueue()
+    return _job_queue
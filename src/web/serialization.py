@@ -0,0 +1,96 @@
+import io
+import zipfile
+
+import numpy as np
+from flask import Response, jsonify
+
+from src.utils.helpers import policy_summary
+
+# Formatos de respuesta para V y policy: nombre -> tipo MIME
+RESPONSE_FORMATS = {
+    'json': 'application/json',
+    'npy': 'application/x-npy',
+    'npz': 'application/x-npz',
+    'summary': 'application/json',
+}
+# Nivel deflate de npz: el nivel 1 comprime V casi igual que el 6 en ~1/4 del tiempo
+NPZ_COMPRESSLEVEL = 1
+
+
+def response_format(request) -> str:
+    """
+    Formato pedido por el cliente: ?format=<nombre> tiene prioridad; si no,
+    se negocia con la cabecera Accept (application/json por defecto).
+    'summary' solo se pide con ?format=summary.
+    """
+    fmt = request.args.get('format')
+    if fmt is not None:
+        if fmt not in RESPONSE_FORMATS:
+            raise ValueError(f"format debe ser uno de {tuple(RESPONSE_FORMATS)}, no {fmt!r}")
+        return fmt
+    best = request.accept_mimetypes.best_match(
+        [RESPONSE_FORMATS['json'], RESPONSE_FORMATS['npy'], RESPONSE_FORMATS['npz']]
+    )
+    return {'application/x-npy': 'npy', 'application/x-npz': 'npz'}.get(best, 'json')
+
+
+def encode_npy(*arrays) -> bytes:
+    """
+    Arreglos .npy concatenados; se leen con np.load sucesivos sobre el mismo archivo.
+    """
+    buffer = io.BytesIO()
+    for array in arrays:
+        np.save(buffer, np.ascontiguousarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def encode_npz(**arrays) -> bytes:
+    """
+    Equivalente a np.savez_compressed con nivel de compresión NPZ_COMPRESSLEVEL.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=NPZ_COMPRESSLEVEL) as archive:
+        for name, array in arrays.items():
+            with archive.open(f'{name}.npy', 'w') as member:
+                np.save(member, np.ascontiguousarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _header_name(field: str) -> str:
+    return 'X-' + '-'.join(word.capitalize() for word in field.split('_'))
+
+
+def solution_response(fmt: str, V, policy, I_init: int = 0, summary=None, **fields):
+    """
+    Respuesta con V y policy en el formato negociado.
+
+    - json: campos + value_function y policy como listas anidadas
+    - npy: V y luego policy como .npy sin comprimir
+    - npz: .npz comprimido con los arreglos V y policy
+    - summary: campos + V0 = V[0, I_init] y el resumen (s_t, S_t) por periodo
+      (summary si se indica, p. ej. DynamicProgrammingSolver.summary(); si no,
+      helpers.policy_summary(policy))
+
+    En los formatos binarios los campos escalares viajan como cabeceras
+    X-<Campo> (p. ej. solution_time -> X-Solution-Time).
+    """
+    V = np.asarray(V)
+    policy = np.asarray(policy)
+    if fmt == 'json':
+        return jsonify({**fields, 'value_function': V.tolist(), 'policy': policy.tolist()})
+    if fmt == 'summary':
+        if summary is None:
+            summary = policy_summary(policy)
+        rows = [{'period': t, 's_t': s_t, 'S_t': S_t} for t, (s_t, S_t) in enumerate(summary)]
+        return jsonify({**fields, 'V0': float(V[0, I_init]), 'policy_summary': rows})
+
+    # Pedidos en el entero sin signo más pequeño que los contiene (sin pérdida)
+    if policy.size and policy.min() >= 0:
+        policy = policy.astype(np.min_scalar_type(policy.max()), copy=False)
+    body = encode_npy(V, policy) if fmt == 'npy' else encode_npz(V=V, policy=policy)
+    headers = {
+        _header_name(name): str(value)
+        for name, value in fields.items()
+        if isinstance(value, (int, float, str))
+    }
+    return Response(body, mimetype=RESPONSE_FORMATS[fmt], headers=headers)
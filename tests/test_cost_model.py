@@ -0,0 +1,29 @@
+import numpy as np
+from src.models.cost_model import CostModel
+from src.models.demand_model import DemandModel
+
+def test_expected_tables_match_direct_sums():
+    support = np.array([0, 2, 3, 7])
+    probs = np.array([0.1, 0.4, 0.3, 0.2])
+    demand = DemandModel(support, probs)
+    model = CostModel(h=2, p=15)
+
+    loss = model.expected_loss(demand, 12)
+    V_next = np.linspace(50, 0, 13) ** 1.5
+    future = model.expected_future(V_next, demand)
+    for y in range(13):
+        direct_loss = np.dot(probs, 2 * np.maximum(y - support, 0) + 15 * np.maximum(support - y, 0))
+        direct_future = np.dot(probs, V_next[np.maximum(y - support, 0)])
+        assert np.isclose(loss[y], direct_loss)
+        assert np.isclose(future[y], direct_future)
+        assert np.isclose(model.expected_cost(0, y, 0, demand, 10), direct_loss)
+
+def test_fft_expectation_matches_direct():
+    support = np.arange(0, 300)
+    probs = np.exp(-0.5 * ((support - 120) / 30.0) ** 2)
+    demand = DemandModel(support, probs / probs.sum())
+    V_next = np.sqrt(np.arange(1001.0))
+
+    direct = CostModel(1, 10, expectation='direct').expected_future(V_next, demand)
+    fft = CostModel(1, 10, expectation='fft').expected_future(V_next, demand)
+    assert np.allclose(direct, fft, rtol=1e-10, atol=1e-9)
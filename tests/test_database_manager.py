@@ -0,0 +1,46 @@
+from src.data import database_manager
+from src.data.database_manager import get_engine, get_session, init_db, remove_session, Optimization
+
+def test_shared_engine_and_request_scoped_session(tmp_path, monkeypatch):
+    db_url = f"sqlite:///{tmp_path / 'shared.db'}"
+    init_db(db_url)
+    monkeypatch.setattr(database_manager, 'DATABASE_URL', db_url)
+    monkeypatch.setattr(database_manager, '_engine', None)
+
+    engine = get_engine()
+    session = get_session()
+    assert get_engine() is engine
+    assert get_session() is session
+    assert session.query(Optimization).count() == 0
+    assert engine.pool.checkedout() == 1
+
+    remove_session()
+    assert engine.pool.checkedout() == 0
+    assert get_session() is not session
+    remove_session()
+
+def test_init_db_upgrades_baseline_optimal_policies(tmp_path):
+    from sqlalchemy import create_engine, inspect, text
+    from src.data.database_manager import OptimalPolicy, backfill_inventory_levels
+    db_url = f"sqlite:///{tmp_path / 'baseline.db'}"
+    with create_engine(db_url).begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE optimal_policies (id INTEGER PRIMARY KEY, optimization_id INTEGER NOT NULL, "
+            "period INTEGER NOT NULL, reorder_point FLOAT NOT NULL, order_up_to_level FLOAT NOT NULL, "
+            "expected_cost FLOAT NOT NULL, created_at DATETIME)"
+        ))
+        for I in range(3):
+            connection.execute(text(
+                f"INSERT INTO optimal_policies (optimization_id, period, reorder_point, order_up_to_level, "
+                f"expected_cost) VALUES (1, 0, {I}, {I + 1}, 0)"
+            ))
+
+    engine = init_db(db_url)
+    assert 'inventory_level' in {c['name'] for c in inspect(engine).get_columns('optimal_policies')}
+    assert database_manager.add_missing_columns(engine) == []
+    assert 'ix_optimal_policies_opt_period_level' in {ix['name'] for ix in inspect(engine).get_indexes('optimal_policies')}
+    init_db(db_url)
+    session = get_session(engine)
+    assert backfill_inventory_levels(session) == 3
+    session.commit()
+    assert [p.inventory_level for p in session.query(OptimalPolicy).order_by(OptimalPolicy.id)] == [0, 1, 2]
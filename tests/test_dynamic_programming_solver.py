@@ -14,3 +14,267 @@ def test_solver_constant_demand():
     solver = DynamicProgrammingSolver(T, I_max, x_max, costs, demand)
     V, policy = solver.solve()
     assert policy.shape == (T, I_max+1)
+
+def test_vectorized_matches_enumeration():
+    T = 4
+    I_max = 30
+    x_max = 12
+    costs = {'c': 10 + 2 * np.sin(np.arange(T)), 'h': 2, 'p': 20}
+    support = np.arange(0, 11)
+    probabilities = np.exp(-np.abs(support - 5))
+    demand = DemandModel(support, probabilities / probabilities.sum())
+
+    V_ref, policy_ref = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='enumeration').solve()
+    V_vec, policy_vec = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='vectorized').solve()
+    assert np.array_equal(V_ref, V_vec)
+    assert np.array_equal(policy_ref, policy_vec)
+
+def test_unknown_method_raises():
+    demand = DemandModel([1], [1])
+    with pytest.raises(ValueError):
+        DynamicProgrammingSolver(2, 5, 5, {'c': [1, 1], 'h': 0, 'p': 1}, demand, method='magic')
+
+def test_order_up_to_matches_enumeration():
+    T = 5
+    I_max = 40
+    x_max = 15
+    costs = {'c': np.full(T, 10), 'h': 2, 'p': 20}
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+
+    reference = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='enumeration')
+    V_ref, _ = reference.solve()
+    V_opt, policy_opt = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='order_up_to').solve()
+    assert np.allclose(V_ref, V_opt)
+    # Con empates exactos el redondeo puede elegir otra acción óptima
+    for t in range(T):
+        for I in range(I_max + 1):
+            assert np.isclose(reference._calculate_expected_cost(t, I, policy_opt[t, I]), V_ref[t, I])
+
+def test_base_stock_matches_order_up_to():
+    T = 12
+    costs = {'c': 10 + 5 * np.sin(2 * np.pi * np.arange(T) / 12), 'h': 1, 'p': 100}
+    support = np.arange(0, 16)
+    probabilities = np.array([3.0 ** k / np.prod(np.arange(1, k + 1)) for k in support])
+    demand = DemandModel(support, probabilities / probabilities.sum())
+
+    V_ref, policy_ref = DynamicProgrammingSolver(T, 100, 20, costs, demand, method='order_up_to').solve()
+    solver = DynamicProgrammingSolver(T, 100, 20, costs, demand, method='base_stock')
+    V_bs, policy_bs = solver.solve()
+    assert np.allclose(V_ref, V_bs)
+    assert np.array_equal(policy_ref, policy_bs)
+    assert solver.fallback_periods == []
+    assert np.all(solver.order_up_to_levels >= 0)
+
+def test_batch_solver_matches_individual_solves():
+    from src.core.batch_solver import BatchDynamicProgrammingSolver
+
+    T = 6
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    c = np.array([5.0, 10.0, 15.0])
+    h = np.array([1.0, 2.0, 5.0])
+    p = np.array([10.0, 20.0, 50.0])
+
+    batch = BatchDynamicProgrammingSolver(T, 60, 25, {'c': c, 'h': h, 'p': p}, demand)
+    V, policy = batch.solve()
+    assert V.shape == (3, T + 1, 61)
+    for s in range(3):
+        single = DynamicProgrammingSolver(T, 60, 25, {'c': np.full(T, c[s]), 'h': h[s], 'p': p[s]},
+                                          demand, method='order_up_to')
+        V_s, policy_s = single.solve()
+        assert np.allclose(V[s], V_s)
+        assert np.array_equal(policy[s], policy_s)
+    assert np.allclose(batch.initial_values(0), V[:, 0, 0])
+
+    # c 1-D de longitud T: ¿por escenario o por periodo? Se exige forma 2-D
+    with pytest.raises(ValueError):
+        BatchDynamicProgrammingSolver(T, 60, 25, {'c': np.full(T, 5.0), 'h': 1, 'p': 10}, demand)
+    column = BatchDynamicProgrammingSolver(T, 60, 25, {'c': c[:, None], 'h': h, 'p': p}, demand)
+    assert np.allclose(column.solve()[0], V)
+
+def test_low_memory_mode_keeps_two_rows_and_compact_policy():
+    T = 8
+    costs = {'c': np.full(T, 10), 'h': 2, 'p': 20}
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    V_full, policy_full = DynamicProgrammingSolver(T, 80, 30, costs, demand, method='order_up_to').solve()
+
+    solver = DynamicProgrammingSolver(T, 80, 30, costs, demand, method='order_up_to', memory_mode='low')
+    V, policy = solver.solve()
+    assert V.shape == (2, 81)
+    assert policy.dtype == np.uint8
+    assert np.allclose(V[0], V_full[0])
+    assert np.array_equal(policy, policy_full)
+
+    solver = DynamicProgrammingSolver(T, 80, 30, costs, demand, method='base_stock',
+                                      memory_mode='low', value_dtype=np.float32)
+    V, policy = solver.solve()
+    assert V.dtype == np.float32
+    assert np.allclose(V[0], V_full[0], rtol=1e-5)
+    assert np.array_equal(np.asarray(policy), policy_full)
+    assert solver.nbytes < V_full.nbytes / 5
+
+def test_incremental_resolve_and_prepend_match_full_solve():
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    c = 10 + 2 * np.sin(np.arange(8))
+    solver = DynamicProgrammingSolver(8, 50, 20, {'c': c, 'h': 2, 'p': 20}, demand)
+    solver.solve()
+
+    c_new = c.copy()
+    c_new[2] += 3
+    V, policy = solver.update_costs(c_new)
+    assert solver.periods_solved == 3
+    V_ref, policy_ref = DynamicProgrammingSolver(8, 50, 20, {'c': c_new, 'h': 2, 'p': 20}, demand).solve()
+    assert np.array_equal(V, V_ref) and np.array_equal(policy, policy_ref)
+
+    V, policy = solver.prepend_periods([9.0, 11.0])
+    assert solver.periods_solved == 2
+    c_ext = np.concatenate([[9.0, 11.0], c_new])
+    V_ref, policy_ref = DynamicProgrammingSolver(10, 50, 20, {'c': c_ext, 'h': 2, 'p': 20}, demand).solve()
+    assert np.array_equal(V, V_ref) and np.array_equal(policy, policy_ref)
+
+@pytest.mark.parametrize('method', ['enumeration', 'vectorized', 'order_up_to', 'base_stock'])
+def test_reachable_pruning_matches_full_solve_on_reachable_states(method):
+    T, I_max, x_max = 6, 60, 8
+    support = np.arange(2, 7)
+    demand = DemandModel(support, np.full(5, 0.2))
+    costs = {'c': np.full(T, 5.0), 'h': 1, 'p': 15}
+    V_full, policy_full = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method=method).solve()
+    solver = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method=method, I_init=3)
+    V, policy = solver.solve()
+
+    assert V.shape == V_full.shape and policy.shape == policy_full.shape
+    assert V[0, 3] == V_full[0, 3]
+    for t, (lo, hi) in enumerate(solver.reachable_bounds):
+        assert np.allclose(V[t, lo:hi + 1], V_full[t, lo:hi + 1], rtol=1e-12)
+        assert np.all(np.isnan(V[t, :lo])) and np.all(np.isnan(V[t, hi + 1:]))
+        if t < T:
+            assert np.array_equal(policy[t, lo:hi + 1], policy_full[t, lo:hi + 1])
+            assert not policy[t, hi + 1:].any()
+    assert tuple(solver.reachable_bounds[1]) == (0, 9)
+
+@pytest.mark.parametrize('memory_mode', ['full', 'low'])
+def test_stationary_detection_stops_early_and_matches_full_horizon(memory_mode):
+    T, I_max, x_max = 200, 60, 20
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    costs = {'c': np.full(T, 4.0), 'h': 1, 'p': 12}
+    V_ref, policy_ref = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='order_up_to').solve()
+    solver = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='order_up_to',
+                                      memory_mode=memory_mode, stationary_tol=1e-9)
+    V, policy = solver.solve()
+
+    assert solver.converged_period is not None and solver.periods_solved < T / 4
+    assert solver.periods_solved == T - solver.converged_period
+    assert np.allclose(V[0], V_ref[0], rtol=1e-9)
+    assert np.array_equal(np.asarray(policy), policy_ref)
+
+    costs['c'] = 4.0 + 0.01 * np.arange(T)
+    solver = DynamicProgrammingSolver(T, I_max, x_max, costs, demand, method='order_up_to', stationary_tol=1e-9)
+    solver.solve()
+    assert solver.converged_period is None and solver.periods_solved == T
+
+@pytest.mark.parametrize('method', ['vectorized', 'order_up_to'])
+def test_parallel_state_chunks_match_serial_solve(method):
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    costs = {'c': 10 + 2 * np.sin(np.arange(5)), 'h': 2, 'p': 20}
+    V_ref, policy_ref = DynamicProgrammingSolver(5, 70, 15, costs, demand, method=method).solve()
+    solver = DynamicProgrammingSolver(5, 70, 15, costs, demand, method=method, n_workers=4, chunk_size=9)
+    V, policy = solver.solve()
+    assert np.array_equal(V, V_ref) and np.array_equal(policy, policy_ref)
+    assert solver._executor is None
+
+def test_checkpointed_solve_resumes_after_interruption(tmp_path):
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    costs = {'c': 10 + 2 * np.sin(np.arange(8)), 'h': 2, 'p': 20}
+    V_ref, policy_ref = DynamicProgrammingSolver(8, 40, 15, costs, demand).solve()
+
+    solver = DynamicProgrammingSolver(8, 40, 15, costs, demand, checkpoint_dir=str(tmp_path))
+    solve_period = solver._solve_period_vectorized
+    def interrupted(t):
+        if t == 3:
+            raise KeyboardInterrupt
+        solve_period(t)
+    solver._solve_period_vectorized = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        solver.solve()
+
+    solver = DynamicProgrammingSolver(8, 40, 15, costs, demand, checkpoint_dir=str(tmp_path))
+    V, policy = solver.solve()
+    assert solver.periods_solved == 4
+    assert isinstance(V, np.memmap) and isinstance(policy, np.memmap)
+    assert np.array_equal(V, V_ref) and np.array_equal(policy, policy_ref)
+
+    # Otro problema en el mismo directorio empieza de cero
+    costs['c'] = costs['c'] + 1
+    solver = DynamicProgrammingSolver(8, 40, 15, costs, demand, checkpoint_dir=str(tmp_path))
+    solver.solve()
+    assert solver.periods_solved == 8
+
+def test_multigrid_refines_coarse_solution_around_thresholds():
+    support = np.arange(0, 81)
+    probs = np.exp(-0.5 * ((support - 40) / 12) ** 2)
+    demand = DemandModel(support, probs / probs.sum())
+    costs = {'c': np.full(10, 10.0), 'h': 2, 'p': 20}
+    V_ref, policy_ref = DynamicProgrammingSolver(10, 600, 150, costs, demand, method='order_up_to').solve()
+    solver = DynamicProgrammingSolver(10, 600, 150, costs, demand, method='multigrid', coarse_step=10)
+    V, policy = solver.solve()
+
+    assert solver.coarse_solver.I_max == 60 and solver.band == 120
+    assert np.allclose(V, V_ref, rtol=1e-12)
+    assert np.array_equal(policy, policy_ref)
+    assert solver.band_edge_periods == []
+    assert solver.approximation_gap.shape == (10,) and np.all(solver.approximation_gap >= 0)
+    with pytest.raises(ValueError):
+        DynamicProgrammingSolver(10, 600, 5, costs, demand, method='multigrid', coarse_step=10)
+
+def test_fixed_cost_sS_matches_enumeration():
+    from src.core.policy_evaluator import PolicyEvaluator
+    support = np.arange(0, 11)
+    probs = np.exp(-np.abs(support - 5))
+    demand = DemandModel(support, probs / probs.sum())
+    costs = {'c': 10 + 2 * np.sin(np.arange(6)), 'h': 2, 'p': 20, 'K': 40}
+    V_ref, policy_ref = DynamicProgrammingSolver(6, 40, 15, costs, demand, method='enumeration').solve()
+
+    V_vec, policy_vec = DynamicProgrammingSolver(6, 40, 15, costs, demand, method='vectorized').solve()
+    assert np.allclose(V_vec, V_ref) and np.array_equal(policy_vec, policy_ref)
+    V_up, policy_up = DynamicProgrammingSolver(6, 40, 15, costs, demand, method='order_up_to').solve()
+    assert np.allclose(V_up, V_ref) and np.array_equal(policy_up, policy_ref)
+
+    solver = DynamicProgrammingSolver(6, 40, 15, costs, demand, method='sS')
+    V, policy = solver.solve()
+    assert np.allclose(V, V_ref)
+    assert solver.fallback_periods == []
+    assert np.all(solver.reorder_points < solver.order_up_to_levels)
+    assert solver.policy_model.summary()[0] == (solver.reorder_points[0], solver.order_up_to_levels[0])
+    # El costo fijo hace que no se pida justo por debajo de S_t
+    assert np.any(solver.reorder_points < solver.order_up_to_levels - 1)
+    evaluation = PolicyEvaluator(np.asarray(policy), costs, demand).evaluate()
+    assert np.isclose(evaluation['total_cost'], V[0, 0])
+
+    # Sin verificación no se calcula el mínimo exacto
+    solver._fixed_cost_rows = None
+    solver.solve()
+
+    # Con x_max pequeño (s, S) deja de ser óptima: la verificación lo corrige
+    tight = {**costs, 'K': 40}
+    V_ref, _ = DynamicProgrammingSolver(6, 40, 6, tight, demand, method='enumeration').solve()
+    V_sS, _ = DynamicProgrammingSolver(6, 40, 6, tight, demand, method='sS').solve()
+    assert np.max(V_sS - V_ref) > 1
+    solver = DynamicProgrammingSolver(6, 40, 6, tight, demand, method='sS', verify_sS=True)
+    V, _ = solver.solve()
+    assert np.allclose(V, V_ref) and solver.fallback_periods
+
+    with pytest.raises(ValueError):
+        DynamicProgrammingSolver(6, 40, 15, costs, demand, method='base_stock')
+
+def test_multigrid_is_exact_on_bimodal_demand():
+    support = np.arange(0, 121)
+    probs = np.exp(-0.5 * ((support - 20) / 5) ** 2) + np.exp(-0.5 * ((support - 100) / 5) ** 2)
+    demand = DemandModel(support, probs / probs.sum())
+    costs = {'c': np.full(10, 10.0), 'h': 2, 'p': 20}
+    V_ref, policy_ref = DynamicProgrammingSolver(10, 600, 150, costs, demand, method='order_up_to').solve()
+
+    # Con la banda por defecto y con una banda que no contiene el mínimo fino
+    for band in (None, 3):
+        solver = DynamicProgrammingSolver(10, 600, 150, costs, demand, method='multigrid', coarse_step=10, band=band)
+        V, policy = solver.solve()
+        assert np.allclose(V, V_ref, rtol=1e-12) and np.array_equal(policy, policy_ref)
+    assert solver.band_edge_periods
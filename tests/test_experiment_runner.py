@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from src.core.batch_solver import BatchDynamicProgrammingSolver
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.experiment_runner import make_instance, run_instances, solve_instance
+from src.models.demand_model import DemandModel
+
+def test_run_instances_preserves_order():
+    support = np.arange(0, 6)
+    probs = np.full(6, 1 / 6)
+    instances = [
+        make_instance(4, 20, 10, {'c': np.full(4, c), 'h': 1, 'p': 15}, support, probs)
+        for c in [2, 4, 6, 8, 10]
+    ]
+    results = run_instances(instances, outputs=('V0', 'policy_summary'), max_workers=2, chunksize=2)
+
+    assert len(results) == len(instances)
+    for c, result in zip([2, 4, 6, 8, 10], results):
+        V, _ = DynamicProgrammingSolver(4, 20, 10, {'c': np.full(4, c), 'h': 1, 'p': 15},
+                                        DemandModel(support, probs)).solve()
+        assert np.isclose(result['V0'], V[0, 0])
+        assert len(result['policy_summary']) == 4
+
+def test_fixed_cost_is_forwarded_or_rejected():
+    support, probs = np.arange(0, 6), np.full(6, 1 / 6)
+    costs = {'c': np.full(4, 10.0), 'h': 1, 'p': 15, 'K': 8}
+    V0 = solve_instance(make_instance(4, 30, 6, costs, support, probs, method='sS'), outputs=('V0',))['V0']
+    V, _ = DynamicProgrammingSolver(4, 30, 6, costs, DemandModel(support, probs), method='enumeration').solve()
+    assert np.isclose(V0, V[0, 0])
+    with pytest.raises(ValueError):
+        BatchDynamicProgrammingSolver(4, 30, 6, costs, DemandModel(support, probs))
@@ -0,0 +1,42 @@
+import numpy as np
+from src.core.infinite_horizon_solver import InfiniteHorizonSolver
+from src.models.demand_model import DemandModel
+
+def test_policy_iteration_reaches_bellman_fixed_point_faster_than_value_iteration():
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    costs = {'c': 4.0, 'h': 1, 'p': 12}
+    solver = InfiniteHorizonSolver(80, 20, costs, demand, discount=0.95, tol=1e-8)
+    V, policy = solver.solve()
+    assert solver.converged and solver.policy_iterations >= 1
+
+    V_next, greedy = solver._bellman(V)
+    assert np.allclose(V_next, V, atol=1e-8)
+    assert np.array_equal(greedy, policy)
+
+    value_iteration = InfiniteHorizonSolver(80, 20, costs, demand, discount=0.95, tol=1e-8, switch_after=None)
+    V_vi, policy_vi = value_iteration.solve()
+    assert value_iteration.converged
+    assert np.allclose(V_vi, V, atol=1e-6)
+    assert np.array_equal(policy_vi, policy)
+    assert solver.iterations < value_iteration.iterations
+
+def test_engine_runs_infinite_horizon_and_rejects_varying_costs():
+    import pytest
+    from src.core.optimization_engine import OptimizationEngine
+    engine = OptimizationEngine(0, 40, 10, 5, [3.0] * 5, 1, 9, list(range(6)), [1 / 6] * 6)
+    V, policy = engine.run_infinite_horizon(discount=0.9)
+    assert V.shape == policy.shape == (41,)
+    engine = OptimizationEngine(0, 40, 10, 2, [3.0, 4.0], 1, 9, list(range(6)), [1 / 6] * 6)
+    with pytest.raises(ValueError):
+        engine.run_infinite_horizon()
+
+def test_policy_iteration_stops_when_policies_cycle():
+    import pytest
+    demand = DemandModel(np.arange(0, 6), np.full(6, 1 / 6))
+    solver = InfiniteHorizonSolver(20, 5, {'c': 3.0, 'h': 1, 'p': 9}, demand, max_policy_iterations=5)
+    # Dos políticas que se alternan indefinidamente
+    a, b = np.zeros(21, dtype=int), np.minimum(5, 20 - np.arange(21))
+    solver._bellman = lambda V: (V, b if solver.policy_iterations % 2 else a)
+    with pytest.warns(RuntimeWarning):
+        V, policy, converged = solver._policy_iteration(a)
+    assert not converged and solver.policy_iterations == 5 and V.shape == (21,)
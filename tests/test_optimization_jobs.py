@@ -0,0 +1,130 @@
+import time
+from src.data.database_manager import get_session, init_db, Optimization, OptimalPolicy, User, Material
+from src.web.optimization_jobs import OptimizationJobQueue
+
+def _pending_optimization(session):
+    session.add(User(id=1, username='u', email='u@example.com', password_hash=''))
+    session.add(Material(id=1, name='m', type='default', unit_cost=0, storage_cost=0, shortage_penalty=0))
+    opt = Optimization(
+        user_id=1, material_id=1, name='async', horizon=3,
+        initial_inventory=0, max_inventory=5, max_order=5,
+        costs={'c': [1, 1, 1], 'h': 2, 'p': 10},
+        demand_params={'support': [0, 1, 2], 'probabilities': [0.3, 0.4, 0.3]},
+        status='pending'
+    )
+    session.add(opt)
+    session.commit()
+    return opt.id
+
+def test_worker_processes_pending_optimization(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    session = get_session(init_db(db_url))
+    optimization_id = _pending_optimization(session)
+
+    jobs = OptimizationJobQueue(n_workers=1, db_url=db_url, poll_interval=0.1)
+    jobs.submit(optimization_id)
+    try:
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            session.expire_all()
+            opt = session.get(Optimization, optimization_id)
+            if opt.status not in ('pending', 'running'):
+                break
+            time.sleep(0.1)
+    finally:
+        jobs.stop(timeout=5)
+
+    assert opt.status == 'completed'
+    assert opt.completed_at is not None and opt.solution_time is not None
+    assert session.query(OptimalPolicy).filter_by(optimization_id=optimization_id).count() == 3 * 6
+
+def test_bulk_rows_match_per_state_costs():
+    import numpy as np
+    from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+    from src.data.database_manager import OptimizationResult
+    from src.models.demand_model import DemandModel
+    from src.web.optimization_jobs import save_solution_rows
+
+    session = get_session(init_db('sqlite://'))
+    _pending_optimization(session)
+    opt = session.get(Optimization, 1)
+    support, probs = np.array([0, 1, 2]), np.array([0.3, 0.4, 0.3])
+    V, policy = DynamicProgrammingSolver(3, 5, 5, opt.costs, DemandModel(support, probs)).solve()
+
+    assert save_solution_rows(session, opt, V, policy, DemandModel(support, probs)) == 2 * 3 * 6
+    session.commit()
+    rows = session.query(OptimizationResult).order_by(OptimizationResult.period, OptimizationResult.inventory_level).all()
+    for r in rows:
+        y = r.inventory_level + policy[r.period, int(r.inventory_level)]
+        assert np.isclose(r.expected_holding_cost, np.sum(probs * np.maximum(y - support, 0) * 2))
+        assert np.isclose(r.expected_shortage_cost, np.sum(probs * np.maximum(support - y, 0) * 10))
+        assert np.isclose(r.total_period_cost, r.optimal_order + r.expected_holding_cost + r.expected_shortage_cost)
+
+def test_blob_storage_reconstructs_rows():
+    import numpy as np
+    from src.data.database_manager import OptimizationResult, PolicySummary, load_solution_arrays
+    from src.models.demand_model import DemandModel
+    from src.web.optimization_jobs import execute_optimization, policy_row_arrays, result_row_arrays
+
+    session = get_session(init_db('sqlite://'))
+    _pending_optimization(session)
+    rows_opt = session.get(Optimization, 1)
+    blob_opt = Optimization(
+        user_id=1, material_id=1, name='blob', horizon=3,
+        initial_inventory=0, max_inventory=5, max_order=5,
+        costs=rows_opt.costs, demand_params=rows_opt.demand_params, status='running'
+    )
+    session.add(blob_opt)
+    session.commit()
+
+    V, policy, _ = execute_optimization(session, rows_opt, 'rows')
+    execute_optimization(session, blob_opt, 'blob')
+    assert session.query(OptimalPolicy).filter_by(optimization_id=blob_opt.id).count() == 0
+
+    arrays = load_solution_arrays(session, blob_opt.id)
+    assert np.array_equal(arrays['value_function'], V)
+    assert np.array_equal(arrays['policy'], policy)
+
+    stored = (session.query(OptimizationResult)
+              .filter_by(optimization_id=rows_opt.id)
+              .order_by(OptimizationResult.period, OptimizationResult.inventory_level).all())
+    demand_dist = DemandModel(blob_opt.demand_params['support'], blob_opt.demand_params['probabilities'])
+    rebuilt = result_row_arrays(arrays['policy'], blob_opt.costs, demand_dist)
+    assert np.allclose(rebuilt['total_period_cost'], [r.total_period_cost for r in stored])
+    assert np.allclose(policy_row_arrays(V, policy)['expected_cost'],
+                       [p.expected_cost for p in session.query(OptimalPolicy)
+                        .filter_by(optimization_id=rows_opt.id)
+                        .order_by(OptimalPolicy.period, OptimalPolicy.id)])
+    assert session.query(PolicySummary).filter_by(optimization_id=blob_opt.id).count() == 3
+
+def test_fixed_cost_summary_comes_from_sS_policy():
+    from src.data.database_manager import PolicySummary
+    from src.web.optimization_jobs import execute_optimization
+
+    session = get_session(init_db('sqlite://'))
+    _pending_optimization(session)
+    opt = session.get(Optimization, 1)
+    opt.costs = {**opt.costs, 'K': 5}
+    session.commit()
+
+    V, policy, evaluation = execute_optimization(session, opt, 'rows')
+    assert abs(evaluation['total_cost'] - V[0, 0]) < 1e-9
+    summary = (session.query(PolicySummary).filter_by(optimization_id=opt.id)
+               .order_by(PolicySummary.period).all())
+    for row in summary:
+        if row.reorder_point is not None:
+            assert policy[row.period, int(row.reorder_point)] > 0
+            assert row.reorder_point < row.order_up_to_level
+
+def test_failed_optimization_is_logged(caplog):
+    from src.web.optimization_jobs import process_optimization
+    session = get_session(init_db('sqlite://'))
+    optimization_id = _pending_optimization(session)
+    opt = session.get(Optimization, optimization_id)
+    opt.costs = {'c': [1, 1, 1], 'h': 2}
+    session.commit()
+
+    with caplog.at_level('ERROR', logger='src.web.optimization_jobs'):
+        assert process_optimization(session, optimization_id)
+    assert session.get(Optimization, optimization_id).status == 'failed'
+    assert f'optimización {optimization_id} falló' in caplog.text and 'KeyError' in caplog.text
@@ -0,0 +1,143 @@
+import json
+import pytest
+from src.data import database_manager
+from src.data.database_manager import init_db
+
+PAYLOAD = {
+    'horizon': 3, 'initial_inventory': 0, 'max_inventory': 5, 'max_order': 5,
+    'costs': {'c': [1, 1, 1], 'h': 2, 'p': 10},
+    'demand_params': {'support': [0, 1, 2], 'probabilities': [0.3, 0.4, 0.3]}
+}
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    db_url = f"sqlite:///{tmp_path / 'api.db'}"
+    init_db(db_url)
+    monkeypatch.setattr(database_manager, 'DATABASE_URL', db_url)
+    monkeypatch.setattr(database_manager, '_engine', None)
+    from src.web.app import app
+    yield app.test_client()
+    database_manager.remove_session()
+
+@pytest.mark.parametrize('storage', ['rows', 'blob'])
+def test_results_keyset_pages_and_ndjson(client, storage):
+    optimization_id = client.post('/optimization/', json={**PAYLOAD, 'storage': storage}).get_json()['optimization_id']
+    url = f'/optimization/{optimization_id}/results'
+    full = client.get(url).get_json()
+    assert len(full) == 3 * 6
+
+    pages, cursor = [], None
+    while True:
+        response = client.get(url, query_string={'limit': 4, **({'after': cursor} if cursor else {})})
+        pages.extend(response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+    assert pages == full
+
+    response = client.get(url, query_string={'format': 'ndjson', 'period_from': 1, 'inventory_to': 2})
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert rows == [r for r in full if r['period'] >= 1 and r['inventory_level'] <= 2]
+
+    policy = client.get(f'/optimization/{optimization_id}/policy', query_string={'period_to': 0}).get_json()
+    assert [p['inventory_level'] for p in policy] == list(range(6))
+    assert client.get(url, query_string={'limit': 0}).status_code == 400
+
+def test_binary_and_summary_formats(client):
+    import io
+    import numpy as np
+    full = client.post('/optimization/', json=PAYLOAD).get_json()
+    V, policy = np.array(full['value_function']), np.array(full['policy'])
+
+    response = client.post('/optimization/', json=PAYLOAD, headers={'Accept': 'application/x-npy'})
+    assert response.mimetype == 'application/x-npy'
+    stream = io.BytesIO(response.get_data())
+    assert np.array_equal(np.load(stream), V) and np.array_equal(np.load(stream), policy)
+    assert float(response.headers['X-Total-Cost']) == full['total_cost']
+
+    archive = np.load(io.BytesIO(client.post('/optimization/?format=npz', json=PAYLOAD).get_data()))
+    assert np.array_equal(archive['V'], V) and np.array_equal(archive['policy'], policy)
+
+    summary = client.post('/optimization/?format=summary', json=PAYLOAD).get_json()
+    assert summary['V0'] == V[0, 0] and len(summary['policy_summary']) == 3
+    assert 'value_function' not in summary
+    assert client.post('/optimization/?format=xml', json=PAYLOAD).status_code == 400
+
+def test_policy_summary_from_solve_time_rows_and_legacy_sql(client):
+    from sqlalchemy import inspect
+    from src.data.database_manager import get_engine, get_session, PolicySummary
+    from src.utils.helpers import policy_summary
+    full = client.post('/optimization/', json=PAYLOAD).get_json()
+    url = f"/optimization/{full['optimization_id']}/policy-summary"
+    assert client.get(url).get_json() == [
+        {'period': t, 's_t': s_t, 'S_t': S_t} for t, (s_t, S_t) in enumerate(policy_summary(full['policy']))
+    ]
+
+    # Optimizaciones anteriores a PolicySummary: agregado en SQL
+    session = get_session()
+    session.query(PolicySummary).delete()
+    session.commit()
+    assert client.get(url).get_json() == [
+        {'period': t, 's_t': s_t, 'S_t': S_t} for t, (s_t, S_t) in enumerate(policy_summary(full['policy']))
+    ]
+    assert client.get('/optimization/999/policy-summary').status_code == 404
+    from src.data.database_manager import OptimalPolicy
+    session.query(OptimalPolicy).update({OptimalPolicy.inventory_level: None})
+    session.commit()
+    assert client.get(url).status_code == 409
+
+    index_names = {ix['name'] for ix in inspect(get_engine()).get_indexes('optimal_policies')}
+    assert 'ix_optimal_policies_opt_period_level' in index_names
+
+def test_fixed_cost_summary_format_matches_policy_summary(client):
+    from src.utils.helpers import policy_summary
+    payload = {
+        'horizon': 4, 'initial_inventory': 0, 'max_inventory': 30, 'max_order': 6,
+        'costs': {'c': [10, 10, 10, 10], 'h': 1, 'p': 15, 'K': 20},
+        'demand_params': {'support': [0, 1, 2, 3, 4, 5], 'probabilities': [1 / 6] * 6}
+    }
+    full = client.post('/optimization/', json=payload).get_json()
+    summary = client.post('/optimization/?format=summary', json=payload).get_json()
+    stored = client.get(f"/optimization/{full['optimization_id']}/policy-summary").get_json()
+    assert summary['policy_summary'] == stored
+    # x_max recorta el pedido en s_t: la tabla no muestra S_t
+    assert [[r['s_t'], r['S_t']] for r in stored] != [list(pair) for pair in policy_summary(full['policy'])]
+
+def test_legacy_policy_rows_without_inventory_level(client):
+    from src.data.database_manager import OptimalPolicy, backfill_inventory_levels, get_session
+    full = client.post('/optimization/', json={**PAYLOAD, 'storage': 'rows'}).get_json()
+    url = f"/optimization/{full['optimization_id']}/policy"
+    expected = client.get(url).get_json()
+
+    session = get_session()
+    session.query(OptimalPolicy).update({OptimalPolicy.inventory_level: None})
+    session.commit()
+    assert client.get(url, query_string={'limit': 2}).status_code == 409
+    assert client.get(url, query_string={'inventory_to': 2}).status_code == 409
+    assert len(client.get(url).get_json()) == 3 * 6
+
+    assert backfill_inventory_levels(session) == 3 * 6
+    session.commit()
+    response = client.get(url, query_string={'limit': 2})
+    assert response.get_json() == expected[:2] and response.headers['X-Next-Cursor'] == '0:1'
+
+def test_blob_pages_decode_solution_once(client, monkeypatch):
+    from src.web.api import optimization_routes
+    rows_id = client.post('/optimization/', json={**PAYLOAD, 'storage': 'rows'}).get_json()['optimization_id']
+    blob_id = client.post('/optimization/', json={**PAYLOAD, 'storage': 'blob'}).get_json()['optimization_id']
+
+    calls = []
+    load = optimization_routes.load_solution_arrays
+    monkeypatch.setattr(optimization_routes, 'load_solution_arrays', lambda *a, **k: calls.append(a) or load(*a, **k))
+    queries = [{'limit': 4}, {'limit': 4, 'after': '1:3'}, {'period_from': 1, 'period_to': 1},
+               {'inventory_from': 2, 'inventory_to': 3, 'limit': 3, 'after': '0:5'}, {'after': '2:5'},
+               {'period_from': 2, 'after': '0:1', 'limit': 2}]
+    for endpoint in ('policy', 'results'):
+        for query in queries:
+            blob = client.get(f'/optimization/{blob_id}/{endpoint}', query_string=query)
+            rows = client.get(f'/optimization/{rows_id}/{endpoint}', query_string=query)
+            assert blob.get_json() == rows.get_json()
+            assert blob.headers.get('X-Next-Cursor') == rows.headers.get('X-Next-Cursor')
+    # Una sola descompresión por optimización y endpoint para todas las páginas
+    assert sum(1 for a in calls if a[1] == blob_id) == 2
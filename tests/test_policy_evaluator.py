@@ -0,0 +1,26 @@
+import numpy as np
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.policy_evaluator import PolicyEvaluator, value_at_risk
+from src.models.demand_model import DemandModel
+
+def test_exact_evaluation_matches_value_function():
+    T = 5
+    costs = {'c': 10 + np.arange(T), 'h': 2, 'p': 20}
+    demand = DemandModel([0, 2, 3, 6], [0.2, 0.3, 0.4, 0.1])
+    V, policy = DynamicProgrammingSolver(T, 30, 12, costs, demand).solve()
+
+    evaluator = PolicyEvaluator(policy, costs, demand, I_init=4)
+    result = evaluator.evaluate()
+    assert np.allclose(result['state_distribution'].sum(axis=1), 1.0)
+    assert np.isclose(result['total_cost'], V[0, 4])
+
+    values, probabilities = evaluator.cost_distribution(bucket_width=1.0)
+    assert np.isclose(probabilities.sum(), 1.0)
+    assert abs(np.dot(values, probabilities) - V[0, 4]) <= T * 0.5
+
+def test_value_at_risk():
+    values = np.array([10.0, 20.0, 30.0])
+    probabilities = np.array([0.5, 0.45, 0.05])
+    assert value_at_risk(values, probabilities, 0.5) == 10.0
+    assert value_at_risk(values, probabilities, 0.95) == 20.0
+    assert value_at_risk(values, probabilities, 0.99) == 30.0
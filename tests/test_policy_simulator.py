@@ -0,0 +1,25 @@
+import numpy as np
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.policy_simulator import PolicySimulator
+from src.models.demand_model import DemandModel
+
+def test_simulated_mean_matches_value_function():
+    T = 6
+    costs = {'c': np.full(T, 10), 'h': 2, 'p': 20}
+    demand = DemandModel(np.arange(0, 11), np.full(11, 1 / 11))
+    V, policy = DynamicProgrammingSolver(T, 60, 30, costs, demand).solve()
+
+    result = PolicySimulator(policy, costs, demand, I_init=0, seed=7).simulate(200_000, batch_size=50_000)
+    assert result['total_cost'].shape == (200_000,)
+    per_period = result['purchase_cost'] + result['holding_cost'] + result['shortage_cost']
+    assert np.isclose(per_period.sum(), result['total_cost'].mean())
+    assert abs(result['total_cost'].mean() - V[0, 0]) < 0.01 * V[0, 0]
+
+def test_seeded_simulation_is_reproducible():
+    costs = {'c': [1, 1, 1], 'h': 2, 'p': 10}
+    demand = DemandModel([0, 1, 2], [0.3, 0.4, 0.3])
+    _, policy = DynamicProgrammingSolver(3, 5, 5, costs, demand).solve()
+
+    a = PolicySimulator(policy, costs, demand, seed=123).simulate(1000)['total_cost']
+    b = PolicySimulator(policy, costs, demand, seed=123).simulate(1000)['total_cost']
+    assert np.array_equal(a, b)
@@ -0,0 +1,73 @@
+import numpy as np
+from src.core.dynamic_programming_solver import DynamicProgrammingSolver
+from src.core.solution_cache import SolutionCache
+from src.models.demand_model import DemandModel
+
+def _solver(c=10):
+    demand = DemandModel(np.arange(0, 6), np.full(6, 1 / 6))
+    return DynamicProgrammingSolver(4, 20, 10, {'c': np.full(4, c), 'h': 1, 'p': 15}, demand)
+
+def test_cache_hit_returns_original_solution(tmp_path):
+    cache = SolutionCache(directory=str(tmp_path))
+    first = _solver()
+    V, policy = cache.solve(first)
+
+    second = _solver()
+    V_hit, policy_hit = cache.solve(second)
+    assert np.array_equal(V, V_hit) and np.array_equal(policy, policy_hit)
+    assert second.solution_time == first.solution_time
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    # Un proceso nuevo encuentra la solución en disco
+    cold = SolutionCache(directory=str(tmp_path))
+    cold.solve(_solver())
+    assert cold.stats()['disk_hits'] == 1
+
+    assert SolutionCache.key_for_solver(_solver(11)) != SolutionCache.key_for_solver(_solver(10))
+
+def test_lru_evicts_by_size():
+    solver = _solver()
+    V, policy = solver.solve()
+    entry_bytes = V.nbytes + policy.nbytes
+    cache = SolutionCache(max_bytes=2 * entry_bytes)
+    for key in ['a', 'b', 'c']:
+        cache.put(key, V, policy, 0.1)
+    assert cache.get('a') is None
+    assert cache.get('c') is not None
+    assert cache.stats()['entries'] == 2
+
+def test_cache_hit_restores_sS_thresholds(tmp_path):
+    demand = DemandModel(np.arange(0, 6), np.full(6, 1 / 6))
+    costs = {'c': np.full(4, 10), 'h': 1, 'p': 15, 'K': 8}
+    cache = SolutionCache(directory=str(tmp_path))
+    first = DynamicProgrammingSolver(4, 30, 6, costs, demand, method='sS')
+    cache.solve(first)
+
+    for hit_cache in (cache, SolutionCache(directory=str(tmp_path))):
+        second = DynamicProgrammingSolver(4, 30, 6, costs, demand, method='sS')
+        hit_cache.solve(second)
+        assert second.policy_model.summary() == first.policy_model.summary()
+        assert second.fallback_periods == first.fallback_periods
+
+def test_multigrid_key_depends_on_grid():
+    demand = DemandModel(np.arange(0, 6), np.full(6, 1 / 6))
+    costs = {'c': np.full(4, 10), 'h': 1, 'p': 15}
+    keys = {SolutionCache.key_for_solver(DynamicProgrammingSolver(4, 100, 20, costs, demand, method='multigrid',
+                                                                  coarse_step=step, band=band))
+            for step, band in ((10, 12), (3, 40), (3, 12))}
+    assert len(keys) == 3
+
+def test_cache_hit_then_incremental_update():
+    cache = SolutionCache()
+    V_cached, _ = cache.solve(_solver())
+    V_cached = V_cached.copy()
+    hit = _solver()
+    cache.solve(hit)
+    V, policy = hit.update_costs(np.array([10, 10, 12, 12]))
+
+    fresh = DynamicProgrammingSolver(4, 20, 10, {'c': np.array([10, 10, 12, 12]), 'h': 1, 'p': 15},
+                                     DemandModel(np.arange(0, 6), np.full(6, 1 / 6)))
+    V_ref, policy_ref = fresh.solve()
+    assert np.allclose(V, V_ref) and np.array_equal(policy, policy_ref)
+    # La entrada en caché no se modifica
+    assert np.array_equal(cache.get(SolutionCache.key_for_solver(_solver()))[0], V_cached)
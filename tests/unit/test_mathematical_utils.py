@@ -0,0 +1,23 @@
+import numpy as np
+from src.utils.helpers import binary_search_minimum
+from src.utils.mathematical_utils import is_unimodal, sparse_window_argmin, window_argmin
+
+def test_window_argmin_prefers_smallest_offset():
+    values = np.array([5.0, 3.0, 3.0, 4.0, 1.0])
+    offset, minimum = window_argmin(values, 3)
+    assert offset.tolist() == [1, 0, 2, 1, 0]
+    assert minimum.tolist() == [3.0, 3.0, 1.0, 1.0, 1.0]
+
+def test_unimodal_search():
+    values = np.array([9.0, 4.0, 2.0, 2.0, 7.0])
+    assert is_unimodal(values)
+    assert binary_search_minimum(values) == 2
+    assert not is_unimodal(np.array([3.0, 1.0, 2.0, 0.0]))
+
+def test_sparse_window_argmin_matches_window_argmin():
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 6, size=57).astype(float)
+    for width in (1, 2, 3, 7, 16, 57, 80):
+        offset, minimum = sparse_window_argmin(values, width)
+        expected_offset, expected_minimum = window_argmin(values, width)
+        assert np.array_equal(offset, expected_offset) and np.array_equal(minimum, expected_minimum)